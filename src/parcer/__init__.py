@@ -1,7 +1,12 @@
 """parcer: arbitrage bot scaffold."""
 
-from .settings import Settings
-from .exchanges import ExchangeClient, normalize_symbol, extract_base_symbol
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .exchanges import ExchangeClient, extract_base_symbol, normalize_symbol
+    from .settings import Settings
 
 __all__ = [
     "Settings",
@@ -9,3 +14,23 @@ __all__ = [
     "normalize_symbol",
     "extract_base_symbol",
 ]
+
+_EXCHANGE_EXPORTS = frozenset({"ExchangeClient", "normalize_symbol", "extract_base_symbol"})
+
+
+def __getattr__(name: str) -> Any:
+    # Resolve public names on first access so that `import parcer` (and
+    # `parcer --help`) does not pull in pydantic models or the exchange layer.
+    if name == "Settings":
+        from .settings import Settings
+
+        return Settings
+    if name in _EXCHANGE_EXPORTS:
+        from . import exchanges
+
+        return getattr(exchanges, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
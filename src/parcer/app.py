@@ -1,18 +1,18 @@
 from __future__ import annotations
 
 import argparse
-import asyncio
 import logging
 import sys
 from pathlib import Path
 
-from .config import load_settings
-from .di import build_container
 from .logging import configure_logging
-from .runtime import run
 
 logger = logging.getLogger(__name__)
 
+_LOG_DIR = Path("logs")
+
+_BOT_PARSER: argparse.ArgumentParser | None = None
+
 
 def main(argv: list[str] | None = None) -> int:
     """Main entry point supporting both CLI commands and background bot mode.
@@ -32,23 +32,37 @@ def main(argv: list[str] | None = None) -> int:
     return _run_cli_mode(argv)
 
 
+def _bot_parser() -> argparse.ArgumentParser:
+    """Return the bot-mode argument parser, building it on first use."""
+    global _BOT_PARSER
+    if _BOT_PARSER is None:
+        parser = argparse.ArgumentParser(
+            prog="parcer bot", description="Run arbitrage bot in background"
+        )
+        parser.add_argument(
+            "--config",
+            default=None,
+            help="Path to YAML config file (default: PARCER_CONFIG or ./config.yml)",
+        )
+        _BOT_PARSER = parser
+    return _BOT_PARSER
+
+
 def _run_bot_mode(argv: list[str]) -> int:
     """Run in background bot mode."""
-    parser = argparse.ArgumentParser(
-        prog="parcer bot", description="Run arbitrage bot in background"
-    )
-    parser.add_argument(
-        "--config",
-        default=None,
-        help="Path to YAML config file (default: PARCER_CONFIG or ./config.yml)",
-    )
-
-    args = parser.parse_args(argv)
-    configure_logging(Path("logs"))
+    args = _bot_parser().parse_args(argv)
+    configure_logging(_LOG_DIR)
 
-    settings = load_settings(args.config)
+    # Imported here so `parcer --help` and CLI commands don't load the
+    # runtime, strategies and exchange adapters they never use.
+    import asyncio
 
+    from .config import load_settings
+    from .di import build_container
     from .exchanges.init import create_exchange_clients_from_settings
+    from .runtime import run
+
+    settings = load_settings(args.config)
 
     exchange_clients = create_exchange_clients_from_settings(settings)
     container = build_container(settings, exchange_clients)
@@ -64,10 +78,10 @@ def _run_cli_mode(argv: list[str]) -> int:
     """Run in CLI mode using Typer."""
     try:
         # Configure basic logging for CLI
-        configure_logging(Path("logs"))
+        configure_logging(_LOG_DIR)
         
         # Import CLI app here to avoid circular import
-        from .cli import app as typer_app, run_cli
+        from .cli import run_cli
         run_cli(argv)
         return 0
     except SystemExit as e:
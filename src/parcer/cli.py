@@ -8,12 +8,16 @@ from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
 import typer
-from rich.console import Console
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.panel import Panel
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.progress import Progress
+
     from .di import AppContainer
     from .history import TradeHistory
     from .orders.manager import OrderManager
@@ -40,17 +44,119 @@ app = typer.Typer(help="Arbitrage trading bot CLI")
 trade_app = typer.Typer(help="Manual trade operations")
 app.add_typer(trade_app, name="trade")
 
-console = Console()
+
+class _LazyConsole:
+    """Create the Rich console on first use.
+
+    Importing rich costs tens of milliseconds, which `--help` and commands
+    that fail early should not pay.
+    """
+
+    __slots__ = ("_console",)
+
+    def __init__(self) -> None:
+        self._console: Console | None = None
+
+    def get(self) -> Console:
+        if self._console is None:
+            from rich.console import Console
+
+            self._console = Console()
+        return self._console
+
+    def __getattr__(self, name: str):
+        return getattr(self.get(), name)
+
+
+console = _LazyConsole()
 logger = logging.getLogger(__name__)
 
+# Spinner/description columns shared by every progress display
+_PROGRESS_COLUMNS: tuple | None = None
+
+
+def _progress() -> Progress:
+    """Return a spinner progress display on the shared console."""
+    global _PROGRESS_COLUMNS
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
+    if _PROGRESS_COLUMNS is None:
+        _PROGRESS_COLUMNS = (
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+        )
+    return Progress(*_PROGRESS_COLUMNS, console=console.get())
+
+
+_LOG_DIR = Path("logs")
+_DATA_DIR = Path("data")
+
+# config path -> (container, history, order_manager) built by init_components
+_COMPONENTS: dict[Optional[Path], tuple] = {}
+
+# Event loop shared by every command run in this process
+_runner: asyncio.Runner | None = None
+
+
+def _run(coro):
+    """Run a coroutine on the shared CLI event loop."""
+    global _runner
+    if _runner is None:
+        _runner = asyncio.Runner()
+    return _runner.run(coro)
+
+
+def _close_runner() -> None:
+    """Close cached components and the shared event loop.
+
+    Exchange clients only hold sessions once the loop has run, so they are
+    closed on it; the history database is closed either way.
+    """
+    global _runner
+    try:
+        if _COMPONENTS:
+            from .exchanges.init import close_all
+
+            for container, history, _order_manager in _COMPONENTS.values():
+                try:
+                    if _runner is not None:
+                        _runner.run(close_all(container.exchange_clients))
+                finally:
+                    history.close()
+    finally:
+        _COMPONENTS.clear()
+        if _runner is not None:
+            _runner.close()
+            _runner = None
+
+
+def _dumps_json(obj) -> str:
+    """Serialize to indented JSON, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    import json
+
+    return json.dumps(obj, indent=2)
+
 
 def run_cli(argv: list[str] | None = None) -> None:
     """Run CLI with optional argv parameter."""
-    app(argv)
+    try:
+        app(argv)
+    finally:
+        _close_runner()
 
 
 def init_components(config_path: Optional[Path] = None):
-    """Initialize core components."""
+    """Initialize core components.
+
+    Components are built once per config path and reused by later calls in
+    the same process.
+    """
+    cached = _COMPONENTS.get(config_path)
+    if cached is not None:
+        return cached
+
     settings = _load_settings(config_path)
     
     # Create exchange clients from settings
@@ -60,18 +166,18 @@ def init_components(config_path: Optional[Path] = None):
     container = _build_container(settings, exchange_clients)
     
     # Configure logging
-    log_dir = Path("logs")
-    _configure_logging(log_dir)
+    _configure_logging(_LOG_DIR)
     
     # Initialize history and order manager
     from .history import TradeHistory
     from .orders.manager import OrderManager
     
-    data_dir = Path("data")
-    history = TradeHistory(data_dir)
+    history = TradeHistory(_DATA_DIR)
     order_manager = OrderManager(settings, history)
     
-    return container, history, order_manager
+    components = (container, history, order_manager)
+    _COMPONENTS[config_path] = components
+    return components
 
 
 @trade_app.command("open")
@@ -86,15 +192,11 @@ def trade_open(
     """Open a new arbitrage position."""
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Opening position...", total=None)
             
             # Run async operation
-            success = asyncio.run(_open_position_async(scenario, exchange_a, exchange_b, symbol, quantity, config, progress, task))
+            success = _run(_open_position_async(scenario, exchange_a, exchange_b, symbol, quantity, config, progress, task))
             
             if not success:
                 raise typer.Exit(1)
@@ -107,6 +209,8 @@ def trade_open(
 
 async def _open_position_async(scenario: str, exchange_a: str, exchange_b: str, symbol: str, quantity: float, config: Optional[Path], progress: Progress, task) -> bool:
     """Async implementation of position opening."""
+    from rich.panel import Panel
+
     container, history, order_manager = init_components(config)
     
     # Validate scenario
@@ -146,6 +250,10 @@ async def _open_position_async(scenario: str, exchange_a: str, exchange_b: str,
         # Get exchange clients
         exchange_client_a = container.exchange_clients[exchange_a]
         exchange_client_b = container.exchange_clients[exchange_b]
+
+        from .exchanges.init import connect_exchange_clients
+
+        await connect_exchange_clients({exchange_a: exchange_client_a, exchange_b: exchange_client_b})
         
         # Execute entry orders
         success = await order_manager.entry_order(
@@ -183,15 +291,11 @@ def trade_close(
     """Close an existing arbitrage position."""
     
     try:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            console=console,
-        ) as progress:
+        with _progress() as progress:
             task = progress.add_task("Closing position...", total=None)
             
             # Run async operation
-            success = asyncio.run(_close_position_async(position_id, config, progress, task))
+            success = _run(_close_position_async(position_id, config, progress, task))
             
             if not success:
                 raise typer.Exit(1)
@@ -204,6 +308,8 @@ def trade_close(
 
 async def _close_position_async(position_id: str, config: Optional[Path], progress: Progress, task) -> bool:
     """Async implementation of position closing."""
+    from rich.panel import Panel
+
     container, history, order_manager = init_components(config)
     
     try:
@@ -222,6 +328,12 @@ async def _close_position_async(position_id: str, config: Optional[Path], progre
         # Get exchange clients
         exchange_client_a = container.exchange_clients[position.exchange_a]
         exchange_client_b = container.exchange_clients[position.exchange_b]
+
+        from .exchanges.init import connect_exchange_clients
+
+        await connect_exchange_clients(
+            {position.exchange_a: exchange_client_a, position.exchange_b: exchange_client_b}
+        )
         
         # Execute exit orders
         success = await order_manager.exit_order(
@@ -250,27 +362,77 @@ async def _close_position_async(position_id: str, config: Optional[Path], progre
         return False
 
 
+_STATUS_FILTERS = {
+    "open": "opened",
+    "opened": "opened",
+    "closed": "closed",
+    "closing": "closing",
+    "error": "error",
+    "pending": "pending",
+}
+
+# Status value -> pre-rendered "[style]STATUS[/style]" markup
+_STATUS_MARKUP = {
+    value: f"[{style}]{value.upper()}[/{style}]"
+    for value, style in {
+        "pending": "dim",
+        "opened": "green",
+        "closed": "blue",
+        "error": "red",
+        "closing": "yellow",
+    }.items()
+}
+
+
+def _position_row(position: Position) -> tuple[str, ...]:
+    status = position.status.value
+    return (
+        position.position_id[:8] + "...",
+        position.scenario.upper(),
+        position.symbol_a,
+        f"{position.exchange_a} vs {position.exchange_b}",
+        _STATUS_MARKUP.get(status) or f"[white]{status.upper()}[/white]",
+        f"{position.entry_spread * 100:.4f}%" if position.entry_spread else "N/A",
+        f"{position.pnl:.6f}" if position.pnl else "0.000000",
+        position.created_at.time().isoformat("seconds"),
+    )
+
+
+def _trade_row(trade: dict) -> tuple[str, ...]:
+    position_id = trade['position_id']
+    exchange_a = trade['exchange_a']
+    exchange_b = trade['exchange_b']
+    quantity = trade['quantity']
+    price = trade['price']
+    pnl = trade['pnl']
+    return (
+        trade['timestamp'][-8:] if trade['timestamp'] else "",  # Just time part
+        trade['event_type'],
+        (position_id[:8] + "...") if position_id and len(position_id) > 8 else (position_id or ""),
+        trade['scenario'] or "",
+        f"{exchange_a} vs {exchange_b}" if exchange_a and exchange_b else exchange_a or exchange_b or "",
+        trade['symbol_a'] or trade['symbol_b'] or "",
+        trade['order_type'] or "",
+        trade['side'] or "",
+        f"{float(quantity):.6f}" if quantity else "",
+        f"{float(price):.6f}" if price else "",
+        f"{float(pnl):.6f}" if pnl else "",
+        trade['status'] or "",
+    )
+
+
 @app.command()
 def positions_list(
     config: Optional[Path] = typer.Option(None, help="Path to config file"),
     status: Optional[str] = typer.Option(None, help="Filter by status (open/closed/error)"),
 ) -> None:
     """List all positions."""
+    from rich.table import Table
     
     try:
         _, history, order_manager = init_components(config)
 
-        normalized_status = None
-        if status:
-            status_map = {
-                "open": "opened",
-                "opened": "opened",
-                "closed": "closed",
-                "closing": "closing",
-                "error": "error",
-                "pending": "pending",
-            }
-            normalized_status = status_map.get(status, status)
+        normalized_status = _STATUS_FILTERS.get(status, status) if status else None
 
         if hasattr(history, "list_positions"):
             positions = history.list_positions(status=normalized_status)
@@ -296,31 +458,9 @@ def positions_list(
         table.add_column("PnL", style="green")
         table.add_column("Created", style="dim")
         
-        for position in sorted(positions, key=lambda p: p.created_at):
-            spread_str = f"{position.entry_spread * 100:.4f}%" if position.entry_spread else "N/A"
-            pnl_str = f"{position.pnl:.6f}" if position.pnl else "0.000000"
-            exchanges = f"{position.exchange_a} vs {position.exchange_b}"
-            created_str = position.created_at.strftime("%H:%M:%S")
-            
-            # Color code status
-            status_style = {
-                "pending": "dim",
-                "opened": "green",
-                "closed": "blue",
-                "error": "red",
-                "closing": "yellow",
-            }.get(position.status.value, "white")
-            
-            table.add_row(
-                position.position_id[:8] + "...",
-                position.scenario.upper(),
-                position.symbol_a,
-                exchanges,
-                f"[{status_style}]{position.status.value.upper()}[/{status_style}]",
-                spread_str,
-                pnl_str,
-                created_str,
-            )
+        add_row = table.add_row
+        for row in [_position_row(p) for p in sorted(positions, key=lambda p: p.created_at)]:
+            add_row(*row)
         
         console.print(table)
         
@@ -346,7 +486,7 @@ def balance_check(
     
     try:
         # Run async operation
-        asyncio.run(_check_balance_async(exchange, symbol, config))
+        _run(_check_balance_async(exchange, symbol, config))
                 
     except Exception as e:
         logger.error("Failed to check balance: %s", e, exc_info=True)
@@ -356,6 +496,8 @@ def balance_check(
 
 async def _check_balance_async(exchange: str, symbol: str, config: Optional[Path]) -> None:
     """Async implementation of balance checking."""
+    from rich.panel import Panel
+
     container, history, _ = init_components(config)
     
     console.print(f"Checking balance on [cyan]{exchange}[/cyan] for [green]{symbol}[/green]...")
@@ -405,12 +547,19 @@ async def _check_balance_async(exchange: str, symbol: str, config: Optional[Path
         console.print(f"[red]Error:[/red] {e}")
 
 
+_CSV_FIELDS = (
+    "timestamp", "event_type", "position_id", "scenario", "exchange_a", "exchange_b",
+    "symbol_a", "symbol_b", "order_type", "side", "quantity", "price", "pnl", "status",
+)
+
+
 @app.command()
 def history_show(
     hours: int = typer.Option(24, help="Show history from last N hours"),
     format_type: str = typer.Option("table", help="Output format (table/json/csv)"),
 ) -> None:
     """Show trade history."""
+    from rich.table import Table
     
     try:
         _, history, _ = init_components()
@@ -422,13 +571,14 @@ def history_show(
             return
         
         if format_type == "json":
-            import json
-            console.print_json(json.dumps(trades, indent=2))
+            console.print_json(_dumps_json(trades))
         elif format_type == "csv":
-            # Simple CSV output
-            console.print("timestamp,event_type,position_id,scenario,exchange_a,exchange_b,symbol_a,symbol_b,order_type,side,quantity,price,pnl,status")
-            for trade in trades:
-                console.print(f"{trade['timestamp']},{trade['event_type']},{trade['position_id']},{trade['scenario']},{trade['exchange_a']},{trade['exchange_b']},{trade['symbol_a']},{trade['symbol_b']},{trade['order_type']},{trade['side']},{trade['quantity']},{trade['price']},{trade['pnl']},{trade['status']}")
+            import csv
+            import sys
+
+            writer = csv.writer(sys.stdout, lineterminator="\n")
+            writer.writerow(_CSV_FIELDS)
+            writer.writerows([trade[field] for field in _CSV_FIELDS] for trade in trades)
         else:
             # Table format
             table = Table(title=f"Trade History (Last {hours} Hours)")
@@ -445,21 +595,9 @@ def history_show(
             table.add_column("PnL", style="green")
             table.add_column("Status", style="white")
             
-            for trade in trades:
-                table.add_row(
-                    trade['timestamp'][-8:] if trade['timestamp'] else "",  # Just time part
-                    trade['event_type'],
-                    (trade['position_id'][:8] + "...") if trade['position_id'] and len(trade['position_id']) > 8 else (trade['position_id'] or ""),
-                    trade['scenario'] or "",
-                    f"{trade['exchange_a']} vs {trade['exchange_b']}" if trade['exchange_a'] and trade['exchange_b'] else trade['exchange_a'] or trade['exchange_b'] or "",
-                    trade['symbol_a'] or trade['symbol_b'] or "",
-                    trade['order_type'] or "",
-                    trade['side'] or "",
-                    f"{float(trade['quantity']):.6f}" if trade['quantity'] else "",
-                    f"{float(trade['price']):.6f}" if trade['price'] else "",
-                    f"{float(trade['pnl']):.6f}" if trade['pnl'] else "",
-                    trade['status'] or "",
-                )
+            add_row = table.add_row
+            for row in [_trade_row(trade) for trade in trades]:
+                add_row(*row)
             
             console.print(table)
             
@@ -473,7 +611,10 @@ def history_show(
 
 def main():
     """CLI main entry point."""
-    app()
+    try:
+        app()
+    finally:
+        _close_runner()
 
 
 if __name__ == "__main__":
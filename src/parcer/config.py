@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+import copy
+import functools
+import hashlib
 import os
+import pickle
+import re
+import tempfile
+import types
 from pathlib import Path
-from typing import Any
+from typing import Any, Union, get_args, get_origin
 
+import pydantic
 import yaml
-from pydantic import ValidationError
+from pydantic import BaseModel, SecretStr, ValidationError
 
+from . import settings as _settings_module
+from .paths import CACHE_DIR as _CACHE_DIR
 from .settings import Settings
 
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+# resolved config path -> (cache key, settings) for repeat loads in one process
+_SETTINGS_MEMO: dict[str, tuple[tuple[Any, ...], Settings]] = {}
+
 
 def _deep_set(obj: dict[str, Any], path: list[str], value: Any) -> None:
     cur: dict[str, Any] = obj
@@ -21,49 +39,184 @@ def _deep_set(obj: dict[str, Any], path: list[str], value: Any) -> None:
     cur[path[-1]] = value
 
 
+# Scalars that resolve the same way under YAML 1.1 (PyYAML) and need no
+# parser: booleans/nulls in the exact spellings YAML accepts, plain decimal
+# integers and floats, and bare words starting with a letter.
+_ENV_LITERALS: dict[str, Any] = {
+    spelling: value
+    for word, value in (
+        ("true", True), ("false", False), ("yes", True), ("no", False),
+        ("on", True), ("off", False), ("null", None),
+    )
+    for spelling in (word, word.capitalize(), word.upper())
+}
+_ENV_LITERALS.update({"~": None, "": None})
+_ENV_INT = re.compile(r"[-+]?(?:0|[1-9][0-9]*)")
+_ENV_FLOAT = re.compile(r"[-+]?[0-9]+\.[0-9]+")
+_ENV_WORD = re.compile(r"[A-Za-z][A-Za-z0-9_./-]*")
+_MISSING = object()
+
+
 def _parse_env_value(raw: str) -> Any:
+    value = _ENV_LITERALS.get(raw, _MISSING)
+    if value is not _MISSING:
+        return value
+    if _ENV_INT.fullmatch(raw):
+        return int(raw)
+    if _ENV_FLOAT.fullmatch(raw):
+        return float(raw)
+    if _ENV_WORD.fullmatch(raw):
+        return raw
     try:
-        return yaml.safe_load(raw)
+        return yaml.load(raw, Loader=_SafeLoader)
     except Exception:
         return raw
 
 
-def _apply_env_overrides(data: dict[str, Any], *, prefix: str = "PARCER_") -> dict[str, Any]:
-    merged: dict[str, Any] = dict(data)
+_RESERVED_ENV_NAMES = frozenset({"CONFIG", "LOG_LEVEL"})
 
-    for key, raw_value in os.environ.items():
-        if not key.startswith(prefix):
-            continue
 
-        remainder = key[len(prefix) :]
-        if remainder in {"CONFIG", "LOG_LEVEL"}:
-            continue
+def _env_overrides(prefix: str = "PARCER_") -> list[tuple[str, str]]:
+    """Return ``(name, value)`` for each override variable, prefix stripped."""
+    cut = len(prefix)
+    return [
+        (key[cut:], value)
+        for key, value in os.environ.items()
+        if key.startswith(prefix) and key[cut:] not in _RESERVED_ENV_NAMES
+    ]
+
+
+def _optional_str(raw: str) -> str | None:
+    return None if _ENV_LITERALS.get(raw, _MISSING) is None else raw
+
+
+def _schema_node(annotation: Any, optional: bool = False) -> Any:
+    """Build the env-override lookup tree for a settings annotation.
+
+    Models become dicts of their fields, ``dict[str, X]`` becomes a ``"*"``
+    wildcard entry and leaves become the converter for the raw env string:
+    string fields keep the value verbatim (so ``API_KEY=12345`` is not turned
+    into an int), everything else goes through ``_parse_env_value``.
+    """
+    origin = get_origin(annotation)
+    if origin is Union or origin is types.UnionType:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        if len(args) == 1:
+            return _schema_node(args[0], optional=len(args) < len(get_args(annotation)))
+        return _parse_env_value
+    if origin is dict:
+        return {"*": _schema_node(get_args(annotation)[1])}
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return {name: _schema_node(field.annotation) for name, field in annotation.model_fields.items()}
+    if annotation is str or annotation is SecretStr:
+        return _optional_str if optional else str
+    return _parse_env_value
+
+
+_ENV_SCHEMA: dict[str, Any] = _schema_node(Settings)
 
+
+def _env_converter(path: list[str]) -> Any:
+    node: Any = _ENV_SCHEMA
+    for part in path:
+        if not isinstance(node, dict):
+            return _parse_env_value
+        node = node.get(part, node.get("*"))
+    return node if callable(node) else _parse_env_value
+
+
+def _apply_env_overrides(data: dict[str, Any], *, prefix: str = "PARCER_") -> dict[str, Any]:
+    overrides = _env_overrides(prefix)
+    if not overrides:
+        return data
+
+    # A shallow copy would let _deep_set write into the caller's nested dicts.
+    merged: dict[str, Any] = copy.deepcopy(data)
+
+    for remainder, raw_value in overrides:
         path = [p.lower() for p in remainder.split("__") if p]
         if not path:
             continue
 
-        _deep_set(merged, path, _parse_env_value(raw_value))
+        _deep_set(merged, path, _env_converter(path)(raw_value))
 
     return merged
 
 
-def load_settings(config_path: str | Path | None = None) -> Settings:
-    if config_path is None:
-        config_path = os.environ.get("PARCER_CONFIG", "config.yml")
+def _env_fingerprint(prefix: str = "PARCER_") -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    for key, value in sorted(_env_overrides(prefix)):
+        digest.update(f"{key}={value}\0".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
 
-    path = Path(config_path)
-    if path.exists():
-        raw = path.read_text(encoding="utf-8")
-        loaded = yaml.safe_load(raw)
-        if loaded is None:
-            data: dict[str, Any] = {}
-        elif isinstance(loaded, dict):
-            data = loaded
-        else:
-            raise ValueError(f"Config root must be a mapping, got: {type(loaded)!r}")
+
+# Bump when the cache layout changes.
+_CACHE_FORMAT = 1
+
+
+@functools.lru_cache(maxsize=None)
+def _schema_stamp() -> tuple[Any, ...]:
+    """Identify the Settings schema that produced a cached instance.
+
+    Cache hits return the pickled model without re-validating it, so a
+    pickle written by another pydantic release or before settings.py was
+    edited must not be reused.
+    """
+    try:
+        mtime = os.stat(_settings_module.__file__).st_mtime_ns
+    except (OSError, TypeError):
+        mtime = 0
+    return (_CACHE_FORMAT, pydantic.VERSION, mtime)
+
+
+def _cache_file(path: Path) -> Path:
+    name = hashlib.blake2b(str(path).encode("utf-8", "surrogateescape"), digest_size=16).hexdigest()
+    return _CACHE_DIR / f"settings-{name}.pkl"
+
+
+def _read_cached_settings(cache_file: Path, key: tuple[Any, ...]) -> Settings | None:
+    try:
+        with cache_file.open("rb") as f:
+            cached_key, settings = pickle.load(f)
+    except Exception:
+        return None
+    if cached_key != key or not isinstance(settings, Settings):
+        return None
+    return settings
+
+
+def _write_cached_settings(cache_file: Path, key: tuple[Any, ...], settings: Settings) -> None:
+    # The pickle holds credentials, so keep it private to the current user
+    # (mkstemp creates files with mode 0600) and swap it in atomically.
+    try:
+        cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump((key, settings), f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, cache_file)
+        except BaseException:
+            os.unlink(tmp)
+            raise
+    except OSError:
+        pass
+
+
+def _load_settings_uncached(path: Path, raw: bytes | None = None) -> Settings:
+    if raw is not None:
+        loaded = yaml.load(raw, Loader=_SafeLoader)
+    elif path.exists():
+        with path.open("rb") as f:
+            loaded = yaml.load(f, Loader=_SafeLoader)
+    else:
+        loaded = None
+
+    if loaded is None:
+        data: dict[str, Any] = {}
+    elif isinstance(loaded, dict):
+        data = loaded
     else:
-        data = {}
+        raise ValueError(f"Config root must be a mapping, got: {type(loaded)!r}")
 
     data = _apply_env_overrides(data)
 
@@ -71,3 +224,53 @@ def load_settings(config_path: str | Path | None = None) -> Settings:
         return Settings.model_validate(data)
     except ValidationError as exc:
         raise ValueError(f"Invalid configuration: {exc}") from exc
+
+
+def load_settings(config_path: str | Path | None = None) -> Settings:
+    """Load settings from YAML config plus PARCER_* environment overrides.
+
+    Validated settings are cached on disk (under ``$XDG_CACHE_HOME/parcer``)
+    keyed by the config file's path, a digest of its contents and the
+    PARCER_* environment, so repeated CLI invocations skip YAML parsing and
+    validation. Within a process, loads are answered from memory while the
+    file's mtime and size are unchanged.
+    """
+    if config_path is None:
+        config_path = os.environ.get("PARCER_CONFIG", "config.yml")
+
+    path = Path(config_path)
+    try:
+        stat = path.stat()
+    except OSError:
+        stat = None
+
+    resolved = path.resolve()
+    key = (
+        str(resolved),
+        stat.st_mtime_ns if stat else 0,
+        stat.st_size if stat else -1,
+        _env_fingerprint(),
+    )
+
+    memo = _SETTINGS_MEMO.get(key[0])
+    if memo is not None and memo[0] == key:
+        return memo[1]
+
+    if stat is None:
+        settings = _load_settings_uncached(path)
+    else:
+        raw = path.read_bytes()
+        content_key = (
+            key[0],
+            hashlib.blake2b(raw, digest_size=16).hexdigest(),
+            key[3],
+            _schema_stamp(),
+        )
+        cache_file = _cache_file(resolved)
+        settings = _read_cached_settings(cache_file, content_key)
+        if settings is None:
+            settings = _load_settings_uncached(path, raw)
+            _write_cached_settings(cache_file, content_key, settings)
+
+    _SETTINGS_MEMO[key[0]] = (key, settings)
+    return settings
@@ -13,9 +13,16 @@ if TYPE_CHECKING:
 @dataclass(slots=True)
 class AppContainer:
     settings: "Settings"
-    shutdown: asyncio.Event = field(default_factory=asyncio.Event)
+    shutdown: asyncio.Event | None = None
     exchange_clients: dict[str, ExchangeClient] = field(default_factory=dict)
 
+    @property
+    def shutdown_event(self) -> asyncio.Event:
+        """Shutdown signal, created on first use so CLI commands never allocate it."""
+        if self.shutdown is None:
+            self.shutdown = asyncio.Event()
+        return self.shutdown
+
 
 def build_container(settings: "Settings", exchange_clients: dict[str, ExchangeClient] | None = None) -> AppContainer:
     """Build application container with exchange clients."""
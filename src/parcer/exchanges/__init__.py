@@ -3,7 +3,7 @@
 from .protocol import ExchangeClient, Balance, Order, PriceUpdate
 from .normalization import normalize_symbol, extract_base_symbol, check_symbol_mismatch
 from .factory import create_exchange_client, EXCHANGE_CLIENTS
-from .base import BaseExchangeClient, ProxyConfig
+from .base import BaseExchangeClient, ExchangeError, ProxyConfig, SharedSession
 
 __all__ = [
     "ExchangeClient",
@@ -16,5 +16,7 @@ __all__ = [
     "create_exchange_client",
     "EXCHANGE_CLIENTS",
     "BaseExchangeClient",
+    "ExchangeError",
     "ProxyConfig",
+    "SharedSession",
 ]
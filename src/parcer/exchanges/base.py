@@ -3,37 +3,364 @@
 from __future__ import annotations
 
 import asyncio
-import hashlib
 import hmac
 import json
 import logging
+import random
 import time
 from abc import ABC, abstractmethod
-from typing import Any, AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import partial
+from typing import Any, AsyncIterator, Awaitable, Callable, NoReturn, Sequence
 
-from .normalization import normalize_symbol
 from .protocol import Balance, Order, PriceUpdate
 
 logger = logging.getLogger(__name__)
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+json_loads: Callable[[str | bytes], Any] = orjson.loads if orjson is not None else json.loads
+
+
+def json_dumps(obj: Any) -> bytes:
+    """Encode ``obj`` as compact JSON bytes, ready to send as a request body."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+# Connection pool tuning shared by every adapter session. Keepalive is well
+# above the 1 s polling interval so pooled TCP/TLS connections are reused
+# instead of being dropped and re-handshaken between polls.
+_CONNECTOR_OPTIONS: dict[str, Any] = {
+    "limit": 0,
+    "limit_per_host": 32,
+    "keepalive_timeout": 75,
+    "ttl_dns_cache": 300,
+}
+
+
+def _new_session() -> aiohttp.ClientSession:
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(**_CONNECTOR_OPTIONS),
+        timeout=aiohttp.ClientTimeout(total=30, sock_connect=5, sock_read=10),
+    )
+
+
+class SharedSession:
+    """One aiohttp session shared by several exchange clients.
+
+    Clients handed the same instance share a connection pool, DNS cache and
+    TLS sessions instead of each holding their own. The session is created
+    on first use, inside the running event loop, and is closed by
+    ``close()`` only; closing a client just drops its reference.
+    """
+
+    def __init__(self) -> None:
+        self._session: aiohttp.ClientSession | None = None
+
+    def get(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            if aiohttp is None:
+                raise ImportError("aiohttp is required for exchange adapters")
+            self._session = _new_session()
+        return self._session
+
+    async def close(self) -> None:
+        session, self._session = self._session, None
+        if session is not None:
+            await session.close()
+
+
+@dataclass(slots=True, frozen=True)
 class ProxyConfig:
-    """HTTP proxy configuration."""
+    """HTTP proxy configuration.
+
+    ``proxy_url`` is resolved once at construction, since it is passed to
+    every request the owning client makes.
+    """
+
+    url: str | None = None
+    username: str | None = None
+    password: str | None = field(default=None, repr=False)
+    proxy_url: str | None = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        proxy_url = self.url or None
+        if proxy_url and self.username and self.password:
+            protocol, sep, rest = proxy_url.partition("://")
+            if not sep:
+                protocol, rest = "http", proxy_url
+            proxy_url = f"{protocol}://{self.username}:{self.password}@{rest}"
+        object.__setattr__(self, "proxy_url", proxy_url)
+
+
+# Polled REST prices are reused for this many seconds, so streams polling the
+# same symbol on one client share a request. At most _PRICE_CACHE_SIZE
+# entries are kept; the oldest is evicted first.
+_PRICE_TTL = 0.25
+_PRICE_CACHE_SIZE = 512
+
+# Common renderings of an empty balance. Parsers test raw amounts against this
+# before calling float(), since most assets in a balance listing are empty.
+ZERO_AMOUNTS = frozenset({0, "0", "0.0", "0.00", "0.00000000"})
+
+
+class ExchangeError(Exception):
+    """Raised when an exchange rejects a request with a non-success status."""
+
+    def __init__(self, message: str, status: int | None = None):
+        super().__init__(message)
+        self.status = status
+
+
+async def reject_response(resp: aiohttp.ClientResponse, message: str) -> NoReturn:
+    """Release an unsuccessful response without reading it and raise.
+
+    The body is never decoded on failure paths; the connection is handed
+    back to the pool (or closed if the body was not consumed) before the
+    error propagates.
+    """
+    status = resp.status
+    await resp.release()
+    raise ExchangeError(f"{message}: {status}", status)
+
+
+# REST polling slows down while prices are unchanged, doubling the interval
+# per stale tick up to 2**_MAX_STALE_TICKS times, and adds up to
+# _POLL_JITTER seconds either way so pollers do not fire in lockstep.
+_MAX_STALE_TICKS = 3
+_POLL_JITTER = 0.05
+
+
+def poll_delay(interval: float, stale_ticks: int) -> float:
+    """Seconds to sleep before the next REST poll."""
+    delay = interval * (1 << min(stale_ticks, _MAX_STALE_TICKS))
+    return max(0.0, delay + random.uniform(-_POLL_JITTER, _POLL_JITTER))
+
+
+def now_ms() -> int:
+    """Current Unix time in milliseconds, from the integer nanosecond clock."""
+    return time.time_ns() // 1_000_000
+
+
+def now_s() -> int:
+    """Current Unix time in whole seconds, from the integer nanosecond clock."""
+    return time.time_ns() // 1_000_000_000
+
+
+async def read_json(resp: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with the fastest available parser."""
+    return json_loads(await resp.read())
+
+
+def _put_latest(queue: asyncio.Queue, item: Any) -> None:
+    """Put ``item`` on a one-slot queue, replacing a value not yet consumed.
+
+    Price subscribers only care about the newest price, so a slow consumer
+    skips stale updates instead of letting them pile up.
+    """
+    if queue.full():
+        queue.get_nowait()
+    queue.put_nowait(item)
+
+
+class _WebSocketHub:
+    """One WebSocket connection multiplexing the price streams of a client.
+
+    Streams register a queue per subscription key (an exchange stream name
+    or instrument id). The reader task (re)subscribes every registered key
+    on connect and fans ``(price, timestamp)`` tuples out to the queues.
+    If no connection ever delivers an update, consumers receive ``None``
+    and fall back to REST polling.
+    """
+
+    def __init__(
+        self,
+        client: BaseExchangeClient,
+        *,
+        url: str,
+        subscribe: Callable[[list[str]], Any],
+        unsubscribe: Callable[[list[str]], Any],
+        route: Callable[[Any], tuple[str, float, int | None] | None],
+        ping: str | None = None,
+        ping_interval: float = 25.0,
+    ):
+        self._client = client
+        self._url = url
+        self._subscribe = subscribe
+        self._unsubscribe = unsubscribe
+        self._route = route
+        self._ping = ping
+        self._ping_interval = ping_interval
+        self._queues: dict[str, set[asyncio.Queue]] = {}
+        self._ws: Any = None
+        self._task: asyncio.Task | None = None
+        self._delivered = False
+
+    async def subscribe(self, key: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        queues = self._queues.setdefault(key, set())
+        queues.add(queue)
+        if len(queues) == 1:
+            await self._send(self._subscribe([key]))
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    async def unsubscribe(self, key: str, queue: asyncio.Queue) -> None:
+        queues = self._queues.get(key)
+        if not queues or queue not in queues:
+            return
+        queues.discard(queue)
+        if queues:
+            return
+        del self._queues[key]
+        if self._queues:
+            await self._send(self._unsubscribe([key]))
+        else:
+            await self.close()
+
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _send(self, frame: Any) -> None:
+        ws = self._ws
+        if ws is None or ws.closed:
+            return
+        try:
+            await ws.send_str(json_dumps(frame).decode())
+        except Exception as e:
+            logger.debug("%s WebSocket send failed: %s", self._client.name, e)
+
+    async def _run(self) -> None:
+        while self._queues:
+            try:
+                await self._connect_and_dispatch()
+            except Exception as e:
+                logger.warning("%s WebSocket error: %s", self._client.name, e)
+            if not self._delivered:
+                break
+            await asyncio.sleep(1.0)
+
+        for queues in self._queues.values():
+            for queue in queues:
+                _put_latest(queue, None)
+
+    async def _connect_and_dispatch(self) -> None:
+        session = await self._client._ensure_session()
+        heartbeat = None if self._ping else self._ping_interval
+        async with session.ws_connect(self._url, heartbeat=heartbeat) as ws:
+            self._ws = ws
+            try:
+                await self._send(self._subscribe(list(self._queues)))
+                while self._queues:
+                    try:
+                        msg = await ws.receive(timeout=self._ping_interval)
+                    except asyncio.TimeoutError:
+                        if self._ping:
+                            await ws.send_str(self._ping)
+                        continue
+                    if msg.type != aiohttp.WSMsgType.TEXT:
+                        if msg.type in (aiohttp.WSMsgType.CLOSE, aiohttp.WSMsgType.CLOSED, aiohttp.WSMsgType.ERROR):
+                            return
+                        continue
+                    if msg.data == "pong":
+                        continue
+                    routed = self._route(json_loads(msg.data))
+                    if routed is None:
+                        continue
+                    key, price, timestamp = routed
+                    for queue in self._queues.get(key, ()):
+                        _put_latest(queue, (price, timestamp))
+                    self._delivered = True
+            finally:
+                self._ws = None
+
+
+class _PollHub:
+    """One REST poller shared by every polled price stream of a client.
+
+    Each tick issues a single all-symbols request through ``fetch_all`` and
+    fans ``(price, timestamp)`` tuples out to the queues registered per
+    exchange symbol, so polling N symbols costs one request instead of N.
+    The poller stops once the last stream unsubscribes.
+    """
 
-    def __init__(self, url: str | None = None, username: str | None = None, password: str | None = None):
-        self.url = url
-        self.username = username
-        self.password = password
+    def __init__(
+        self,
+        client: BaseExchangeClient,
+        fetch_all: Callable[[], Awaitable[dict[str, float]]],
+        interval: float,
+    ):
+        self._client = client
+        self._fetch_all = fetch_all
+        self._interval = interval
+        self._queues: dict[str, set[asyncio.Queue]] = {}
+        self._task: asyncio.Task | None = None
+
+    def subscribe(self, key: str) -> asyncio.Queue:
+        queue: asyncio.Queue = asyncio.Queue(maxsize=1)
+        self._queues.setdefault(key, set()).add(queue)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return queue
+
+    async def unsubscribe(self, key: str, queue: asyncio.Queue) -> None:
+        queues = self._queues.get(key)
+        if not queues or queue not in queues:
+            return
+        queues.discard(queue)
+        if not queues:
+            del self._queues[key]
+        if not self._queues:
+            await self.close()
 
-    @property
-    def proxy_url(self) -> str | None:
-        if not self.url:
-            return None
-        if self.username and self.password:
-            protocol = self.url.split("://")[0] if "://" in self.url else "http"
-            rest = self.url.split("://")[1] if "://" in self.url else self.url
-            return f"{protocol}://{self.username}:{self.password}@{rest}"
-        return self.url
+    async def close(self) -> None:
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+
+    async def _run(self) -> None:
+        last: dict[str, float] = {}
+        stale = 0
+        while self._queues:
+            try:
+                prices = await self._fetch_all()
+            except Exception as e:
+                logger.error("Error polling %s prices: %s", self._client.name, e)
+            else:
+                timestamp = now_ms()
+                moved = False
+                for key, queues in self._queues.items():
+                    price = prices.get(key)
+                    if price is not None:
+                        if last.get(key) != price:
+                            last[key] = price
+                            moved = True
+                        for queue in queues:
+                            _put_latest(queue, (price, timestamp))
+                stale = 0 if moved else stale + 1
+            await asyncio.sleep(poll_delay(self._interval, stale))
 
 
 class BaseExchangeClient(ABC):
@@ -48,6 +375,7 @@ class BaseExchangeClient(ABC):
         passphrase: str | None = None,
         sandbox: bool = False,
         proxy: ProxyConfig | None = None,
+        session: SharedSession | None = None,
         **options: Any,
     ):
         """Initialize exchange client.
@@ -59,32 +387,47 @@ class BaseExchangeClient(ABC):
             passphrase: API passphrase (OKX, Bybit, Bitget)
             sandbox: Use sandbox/testnet environment
             proxy: Proxy configuration
+            session: Shared HTTP session to use instead of a private one
             **options: Additional exchange-specific options
         """
         self.name = name
         self.api_key = api_key
         self.api_secret = api_secret
+        # Naming the digest makes hmac build OpenSSL's HMAC directly.
+        self._hmac_template = hmac.new(api_secret.encode(), digestmod="sha256")
         self.passphrase = passphrase
         self.sandbox = sandbox
         self.proxy = proxy or ProxyConfig()
         self.options = options
+        self.shared_session = session
+        self.session: aiohttp.ClientSession | None = None
+        self._ws_hubs: dict[str, _WebSocketHub] = {}
+        self._poll_hubs: dict[str, _PollHub] = {}
+        self._price_cache: dict[tuple[str, str], tuple[float, float]] = {}
+        self._price_fetches: dict[tuple[str, str], asyncio.Future[float | None]] = {}
 
     @staticmethod
-    def generate_signature(secret: str, message: str, method: str = "hmac-sha256") -> str:
+    def generate_signature(secret: bytes, message: bytes) -> str:
         """Generate HMAC-SHA256 signature.
 
         Args:
-            secret: Secret key
-            message: Message to sign
-            method: Signature method (default: hmac-sha256)
+            secret: Secret key, already encoded
+            message: Message to sign, already encoded
 
         Returns:
             Hex-encoded signature
         """
-        if method == "hmac-sha256":
-            return hmac.new(secret.encode(), message.encode(), hashlib.sha256).hexdigest()
-        else:
-            raise ValueError(f"Unsupported signature method: {method}")
+        return hmac.new(secret, message, "sha256").hexdigest()
+
+    def _hmac(self, message: str | bytes) -> hmac.HMAC:
+        """Return the HMAC-SHA256 of ``message`` keyed with the API secret.
+
+        Copies a template keyed once in ``__init__``, so the secret is not
+        re-encoded and the key pads are not recomputed for every request.
+        """
+        mac = self._hmac_template.copy()
+        mac.update(message if isinstance(message, bytes) else message.encode())
+        return mac
 
     def get_base_url(self) -> str:
         """Get base API URL.
@@ -119,6 +462,33 @@ class BaseExchangeClient(ABC):
         """Place a market order."""
         ...
 
+    async def place_market_orders(
+        self,
+        orders: Sequence[tuple[str, str, float]],
+        concurrency: int = 8,
+    ) -> list[Order | Exception]:
+        """Place a burst of market orders concurrently.
+
+        Up to ``concurrency`` requests are in flight at once, so one order is
+        signed and sent while earlier responses are still pending. Every order
+        is awaited to completion; a failed order does not cancel the others.
+
+        Args:
+            orders: ``(symbol, side, quantity)`` tuples
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            The placed Order, or the exception it raised, for each entry of
+            ``orders`` in the same order
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def place(symbol: str, side: str, quantity: float) -> Order:
+            async with semaphore:
+                return await self.place_market_order(symbol, side, quantity)
+
+        return await asyncio.gather(*(place(*order) for order in orders), return_exceptions=True)
+
     @abstractmethod
     async def cancel_order(self, order_id: str, symbol: str | None = None) -> Order:
         """Cancel an active order."""
@@ -151,26 +521,150 @@ class BaseExchangeClient(ABC):
             yield price_update
 
     async def _rest_poll_mark_price(self, symbol: str, interval: float = 1.0) -> AsyncIterator[PriceUpdate]:
-        """REST polling for mark prices."""
+        """REST polling for mark prices.
+
+        Adapters that implement ``_fetch_mark_prices`` share one all-symbols
+        request per tick between every polled symbol.
+        """
+        if type(self)._fetch_mark_prices is not BaseExchangeClient._fetch_mark_prices:
+            async with aclosing(self._poll_shared("mark", self._fetch_mark_prices, symbol, interval)) as updates:
+                async for update in updates:
+                    yield update
+            return
+        last_price = None
+        stale = 0
         while True:
             try:
-                price = await self._fetch_mark_price(symbol)
+                price = await self._cached_price("mark", symbol, self._fetch_mark_price)
                 if price is not None:
-                    yield PriceUpdate(symbol, price, int(time.time() * 1000))
+                    stale = stale + 1 if price == last_price else 0
+                    last_price = price
+                    yield PriceUpdate(symbol, price, now_ms())
             except Exception as e:
                 logger.error(f"Error fetching mark price for {symbol}: {e}")
-            await asyncio.sleep(interval)
+            await asyncio.sleep(poll_delay(interval, stale))
 
     async def _rest_poll_spot_price(self, symbol: str, interval: float = 1.0) -> AsyncIterator[PriceUpdate]:
-        """REST polling for spot prices."""
+        """REST polling for spot prices.
+
+        Adapters that implement ``_fetch_spot_prices`` share one all-symbols
+        request per tick between every polled symbol.
+        """
+        if type(self)._fetch_spot_prices is not BaseExchangeClient._fetch_spot_prices:
+            async with aclosing(self._poll_shared("spot", self._fetch_spot_prices, symbol, interval)) as updates:
+                async for update in updates:
+                    yield update
+            return
+        last_price = None
+        stale = 0
         while True:
             try:
-                price = await self._fetch_spot_price(symbol)
+                price = await self._cached_price("spot", symbol, self._fetch_spot_price)
                 if price is not None:
-                    yield PriceUpdate(symbol, price, int(time.time() * 1000))
+                    stale = stale + 1 if price == last_price else 0
+                    last_price = price
+                    yield PriceUpdate(symbol, price, now_ms())
             except Exception as e:
                 logger.error(f"Error fetching spot price for {symbol}: {e}")
-            await asyncio.sleep(interval)
+            await asyncio.sleep(poll_delay(interval, stale))
+
+    def _ws_hub(self, name: str, **kwargs: Any) -> _WebSocketHub:
+        """Return the client's WebSocket hub called ``name``, creating it once."""
+        hub = self._ws_hubs.get(name)
+        if hub is None:
+            hub = self._ws_hubs[name] = _WebSocketHub(self, **kwargs)
+        return hub
+
+    async def _stream_prices(
+        self,
+        symbol: str,
+        hub: _WebSocketHub | None,
+        key: str,
+        poll: Callable[[str], AsyncIterator[PriceUpdate]],
+    ) -> AsyncIterator[PriceUpdate]:
+        """Stream prices for ``key`` from a WebSocket hub, falling back to REST.
+
+        The stream switches to ``poll`` for good if the hub cannot deliver
+        (no WebSocket URL, handshake refused, ...).
+        """
+        if hub is not None:
+            queue = await hub.subscribe(key)
+            try:
+                while (item := await queue.get()) is not None:
+                    yield PriceUpdate(symbol, item[0], item[1])
+            finally:
+                await hub.unsubscribe(key, queue)
+            logger.warning("%s WebSocket unavailable for %s, using REST polling", self.name, symbol)
+
+        async with aclosing(poll(symbol)) as updates:
+            async for update in updates:
+                yield update
+
+    async def _poll_shared(
+        self,
+        name: str,
+        fetch_all: Callable[[], Awaitable[dict[str, float]]],
+        symbol: str,
+        interval: float,
+    ) -> AsyncIterator[PriceUpdate]:
+        """Stream ``symbol`` from the client's shared REST poller ``name``.
+
+        The poller is created by the first stream and keeps that stream's
+        interval. Prices are keyed by the upper-cased exchange symbol.
+        """
+        hub = self._poll_hubs.get(name)
+        if hub is None:
+            hub = self._poll_hubs[name] = _PollHub(self, fetch_all, interval)
+        key = symbol.upper()
+        queue = hub.subscribe(key)
+        try:
+            while True:
+                price, timestamp = await queue.get()
+                yield PriceUpdate(symbol, price, timestamp)
+        finally:
+            await hub.unsubscribe(key, queue)
+
+    async def _cached_price(
+        self,
+        kind: str,
+        symbol: str,
+        fetch: Callable[[str], Awaitable[float | None]],
+    ) -> float | None:
+        """Return ``fetch(symbol)``, reusing a result younger than ``_PRICE_TTL``.
+
+        Concurrent misses for the same key wait on a single in-flight
+        request. It runs as its own task, so a cancelled caller does not
+        abort the fetch for the others.
+        """
+        key = (kind, symbol)
+        hit = self._price_cache.get(key)
+        if hit is not None and hit[1] > time.monotonic():
+            return hit[0]
+
+        task = self._price_fetches.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._fetch_price(key, fetch))
+            self._price_fetches[key] = task
+            task.add_done_callback(partial(self._forget_price_fetch, key))
+        return await asyncio.shield(task)
+
+    def _forget_price_fetch(self, key: tuple[str, str], task: asyncio.Future[float | None]) -> None:
+        if self._price_fetches.get(key) is task:
+            del self._price_fetches[key]
+
+    async def _fetch_price(
+        self,
+        key: tuple[str, str],
+        fetch: Callable[[str], Awaitable[float | None]],
+    ) -> float | None:
+        price = await fetch(key[1])
+        if price is not None:
+            cache = self._price_cache
+            cache.pop(key, None)
+            if len(cache) >= _PRICE_CACHE_SIZE:
+                del cache[next(iter(cache))]
+            cache[key] = (price, time.monotonic() + _PRICE_TTL)
+        return price
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -180,6 +674,54 @@ class BaseExchangeClient(ABC):
         """Fetch current spot price."""
         raise NotImplementedError()
 
+    async def _fetch_mark_prices(self) -> dict[str, float]:
+        """Fetch mark prices for every symbol in one request.
+
+        Optional; adapters whose API has an all-symbols endpoint override
+        this to enable shared polling.
+        """
+        raise NotImplementedError()
+
+    async def _fetch_spot_prices(self) -> dict[str, float]:
+        """Fetch spot prices for every symbol in one request.
+
+        Optional; adapters whose API has an all-symbols endpoint override
+        this to enable shared polling.
+        """
+        raise NotImplementedError()
+
+    async def _ensure_session(self) -> aiohttp.ClientSession:
+        """Return the client's HTTP session, creating it on first use.
+
+        The session is kept for the lifetime of the client so connections are
+        pooled across requests. Clients given a ``SharedSession`` use its
+        session instead of opening their own. Nothing between the check and
+        the assignment awaits, so concurrent first requests cannot each
+        open a session and no lock is needed.
+        """
+        if self.session is None:
+            if self.shared_session is not None:
+                self.session = self.shared_session.get()
+            else:
+                if aiohttp is None:
+                    raise ImportError(f"aiohttp is required for {self.name} adapter")
+                self.session = _new_session()
+        return self.session
+
+    async def connect(self) -> None:
+        """Prepare connections ahead of the first request."""
+        await self._ensure_session()
+
     async def close(self) -> None:
         """Close connections."""
-        pass
+        for hub in self._ws_hubs.values():
+            await hub.close()
+        for poller in self._poll_hubs.values():
+            await poller.close()
+        for task in self._price_fetches.values():
+            task.cancel()
+        self._price_fetches.clear()
+        if self.session is not None:
+            if self.shared_session is None:
+                await self.session.close()
+            self.session = None
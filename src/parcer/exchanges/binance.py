@@ -2,23 +2,40 @@
 
 from __future__ import annotations
 
-import asyncio
-import hashlib
-import hmac
-import json
+import itertools
 import logging
-import time
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
+from .base import BaseExchangeClient, ProxyConfig, _WebSocketHub, now_ms, read_json, reject_response
+from .protocol import Balance, Order, PriceUpdate
 
-from .base import BaseExchangeClient, ProxyConfig
-from .protocol import Balance, Order
+
+# How Binance renders an empty amount
+_ZERO_AMOUNT = "0.00000000"
+
+
+def _parse_balances(entries: list[dict[str, str]]) -> list[Balance]:
+    """Build balances for the held assets of an account payload.
+
+    Binance lists every asset (1500+), almost all with zero amounts. Those
+    are skipped by comparing the raw strings, so float() only runs for the
+    few entries that may be non-zero.
+    """
+    balances = []
+    append = balances.append
+    for entry in entries:
+        free = entry["free"]
+        locked = entry["locked"]
+        if free == _ZERO_AMOUNT and locked == _ZERO_AMOUNT:
+            continue
+        free_amount = float(free)
+        locked_amount = float(locked)
+        if free_amount > 0 or locked_amount > 0:
+            append(Balance(entry["asset"], free_amount, locked_amount))
+    return balances
 
 
 class BinanceClient(BaseExchangeClient):
@@ -43,7 +60,10 @@ class BinanceClient(BaseExchangeClient):
             recv_window_ms=recv_window_ms,
             **options,
         )
-        self.session = None
+        self._headers = {
+            "X-MBX-APIKEY": api_key,
+            "User-Agent": "parcer/1.0",
+        }
         self.recv_window_ms = recv_window_ms
 
     def get_base_url(self) -> str:
@@ -54,35 +74,26 @@ class BinanceClient(BaseExchangeClient):
     def get_ws_url(self) -> str:
         if self.sandbox:
             return "wss://stream.binancefuture.com"
-        return "wss://stream.binancefuture.com"
-
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for Binance adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
+        return "wss://fstream.binance.com"
 
     def _get_headers(self) -> dict[str, str]:
-        return {
-            "X-MBX-APIKEY": self.api_key,
-            "User-Agent": "parcer/1.0",
-        }
+        # aiohttp copies request headers, so the same dict can be passed every time
+        return self._headers
 
     def _sign_params(self, params: dict[str, Any]) -> dict[str, Any]:
-        """Add server timestamp and signature to params."""
+        """Add server timestamp and signature to params.
+
+        Binance verifies the signature against the query string exactly as
+        sent, so it is computed over the parameters in insertion order, the
+        order aiohttp encodes them in. Values are symbols, sides and numbers,
+        which need no escaping.
+        """
         params = dict(params)
-        params["timestamp"] = int(time.time() * 1000)
+        params["timestamp"] = now_ms()
         params["recvWindow"] = self.recv_window_ms
 
-        query_string = "&".join(f"{k}={v}" for k, v in sorted(params.items()))
-        signature = hmac.new(
-            self.api_secret.encode(),
-            query_string.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        params["signature"] = signature
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        params["signature"] = self._hmac(query_string).hexdigest()
         return params
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
@@ -93,22 +104,19 @@ class BinanceClient(BaseExchangeClient):
 
         async with session.get(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
-        balances = [
-            Balance(b["asset"], float(b["free"]), float(b["locked"]))
-            for b in data.get("balances", [])
-            if float(b["free"]) > 0 or float(b["locked"]) > 0
-        ]
+        entries = data.get("balances", [])
 
         if asset:
-            for b in balances:
-                if b.asset.upper() == asset.upper():
-                    return b
-            return Balance(asset.upper(), 0, 0)
+            wanted = asset.upper()
+            for entry in entries:
+                if entry["asset"].upper() == wanted:
+                    return Balance(entry["asset"], float(entry["free"]), float(entry["locked"]))
+            return Balance(wanted, 0, 0)
 
-        return balances
+        return _parse_balances(entries)
 
     async def place_market_order(
         self,
@@ -128,8 +136,8 @@ class BinanceClient(BaseExchangeClient):
 
         async with session.post(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         return Order(
             str(data["orderId"]),
@@ -154,8 +162,8 @@ class BinanceClient(BaseExchangeClient):
 
         async with session.delete(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         return Order(
             str(data["orderId"]),
@@ -180,7 +188,37 @@ class BinanceClient(BaseExchangeClient):
 
         async with session.post(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
+
+    async def stream_mark_price(self, symbol: str) -> AsyncIterator[PriceUpdate]:
+        """Stream mark prices over the shared futures WebSocket."""
+        async with aclosing(self._stream_prices(
+            symbol,
+            self._mark_price_hub(),
+            f"{symbol.lower()}@markPrice",
+            self._rest_poll_mark_price,
+        )) as updates:
+            async for update in updates:
+                yield update
+
+    def _mark_price_hub(self) -> _WebSocketHub:
+        request_ids = itertools.count(1)
+
+        def frame(method: str, streams: list[str]) -> dict[str, Any]:
+            return {"method": method, "params": streams, "id": next(request_ids)}
+
+        def route(data: dict[str, Any]) -> tuple[str, float, int | None] | None:
+            if data.get("e") != "markPriceUpdate":
+                return None
+            return f"{data['s'].lower()}@markPrice", float(data["p"]), data.get("E")
+
+        return self._ws_hub(
+            "markPrice",
+            url=f"{self.get_ws_url()}/ws",
+            subscribe=lambda streams: frame("SUBSCRIBE", streams),
+            unsubscribe=lambda streams: frame("UNSUBSCRIBE", streams),
+            route=route,
+        )
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -192,7 +230,7 @@ class BinanceClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("markPrice"))
         except Exception:
             return None
@@ -207,12 +245,31 @@ class BinanceClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("price"))
         except Exception:
             return None
 
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
+    async def _fetch_mark_prices(self) -> dict[str, float]:
+        """Fetch mark prices for all futures symbols."""
+        session = await self._ensure_session()
+        url = f"{self.get_base_url()}/fapi/v1/premiumIndex"
+
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                await reject_response(resp, "Failed to fetch mark prices")
+            data = await read_json(resp)
+
+        return {item["symbol"]: float(item["markPrice"]) for item in data}
+
+    async def _fetch_spot_prices(self) -> dict[str, float]:
+        """Fetch spot prices for all symbols."""
+        session = await self._ensure_session()
+        url = f"{self.get_base_url()}/api/v3/ticker/price"
+
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                await reject_response(resp, "Failed to fetch spot prices")
+            data = await read_json(resp)
+
+        return {item["symbol"]: float(item["price"]) for item in data}
@@ -2,23 +2,24 @@
 
 from __future__ import annotations
 
-import base64
-import hashlib
-import hmac
-import json
+import binascii
 import logging
-import time
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
-from .protocol import Balance, Order
+from .base import (
+    ZERO_AMOUNTS,
+    BaseExchangeClient,
+    ProxyConfig,
+    _WebSocketHub,
+    json_dumps,
+    now_ms,
+    read_json,
+    reject_response,
+)
+from .protocol import Balance, Order, PriceUpdate
 
 
 class BitgetClient(BaseExchangeClient):
@@ -43,7 +44,12 @@ class BitgetClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._header_template = {
+            "ACCESS-KEY": api_key,
+            "ACCESS-PASSPHRASE": passphrase,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
@@ -52,38 +58,20 @@ class BitgetClient(BaseExchangeClient):
 
     def get_ws_url(self) -> str:
         if self.sandbox:
-            return "wss://ws.bitget.com/v2/public"
-        return "wss://ws.bitget.com/v2/public"
-
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for Bitget adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
+            return "wss://ws.bitget.com/v2/ws/public"
+        return "wss://ws.bitget.com/v2/ws/public"
 
     def _get_headers(self, timestamp: str, signature: str) -> dict[str, str]:
-        return {
-            "ACCESS-KEY": self.api_key,
-            "ACCESS-SIGN": signature,
-            "ACCESS-TIMESTAMP": timestamp,
-            "ACCESS-PASSPHRASE": self.passphrase,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
-
-    def _sign_request(self, method: str, path: str, body: str = "") -> tuple[str, str]:
-        """Generate Bitget signature."""
-        timestamp = str(int(time.time() * 1000))
-        message = timestamp + method + path + body
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256,
-            ).digest()
-        ).decode()
+        headers = self._header_template.copy()
+        headers["ACCESS-SIGN"] = signature
+        headers["ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+    def _sign_request(self, method: str, path: str, body: bytes = b"") -> tuple[str, str]:
+        """Generate Bitget signature over the exact body bytes sent."""
+        timestamp = str(now_ms())
+        message = f"{timestamp}{method}{path}".encode() + body
+        signature = binascii.b2a_base64(self._hmac(message).digest(), newline=False).decode()
         return timestamp, signature
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
@@ -95,22 +83,27 @@ class BitgetClient(BaseExchangeClient):
 
         async with session.get(url, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
         balances = []
+        append = balances.append
         for item in data.get("data", []):
-            curr = item.get("coinId")
-            free = float(item.get("available", 0))
-            locked = float(item.get("locked", 0))
+            free = item.get("available", 0)
+            locked = item.get("locked", 0)
+            if free in ZERO_AMOUNTS and locked in ZERO_AMOUNTS:
+                continue
+            free = float(free)
+            locked = float(locked)
             if free > 0 or locked > 0:
-                balances.append(Balance(curr, free, locked))
+                append(Balance(item.get("coinId"), free, locked))
 
         if asset:
+            wanted = asset.upper()
             for b in balances:
-                if b.asset.upper() == asset.upper():
+                if b.asset.upper() == wanted:
                     return b
-            return Balance(asset.upper(), 0, 0)
+            return Balance(wanted, 0, 0)
 
         return balances
 
@@ -124,7 +117,7 @@ class BitgetClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/v2/spot/trade/place-order"
 
-        body = json.dumps({
+        body = json_dumps({
             "symbol": symbol.lower(),
             "side": side.lower(),
             "orderType": "market",
@@ -136,8 +129,8 @@ class BitgetClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_data = data.get("data", {})
         return Order(
@@ -157,7 +150,7 @@ class BitgetClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/v2/spot/trade/cancel-order"
 
-        body = json.dumps({
+        body = json_dumps({
             "orderId": order_id,
             "symbol": symbol.lower(),
         })
@@ -167,8 +160,8 @@ class BitgetClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         order_data = data.get("data", {})
         return Order(
@@ -188,7 +181,7 @@ class BitgetClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/v2/mix/account/set-leverage"
 
-        body = json.dumps({
+        body = json_dumps({
             "symbol": symbol.lower(),
             "leverage": str(int(leverage)),
             "marginMode": "isolated",
@@ -199,7 +192,7 @@ class BitgetClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -211,11 +204,47 @@ class BitgetClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", [{}])[0].get("markPrice"))
         except Exception:
             return None
 
+    async def stream_spot_price(self, symbol: str) -> AsyncIterator[PriceUpdate]:
+        """Stream spot prices over the shared public ticker WebSocket."""
+        async with aclosing(self._stream_prices(
+            symbol,
+            self._spot_ticker_hub(),
+            symbol.upper(),
+            self._rest_poll_spot_price,
+        )) as updates:
+            async for update in updates:
+                yield update
+
+    def _spot_ticker_hub(self) -> _WebSocketHub:
+        def frame(op: str, inst_ids: list[str]) -> dict[str, Any]:
+            return {
+                "op": op,
+                "args": [{"instType": "SPOT", "channel": "ticker", "instId": inst_id} for inst_id in inst_ids],
+            }
+
+        def route(data: dict[str, Any]) -> tuple[str, float, int | None] | None:
+            arg = data.get("arg") or {}
+            tickers = data.get("data")
+            if arg.get("channel") != "ticker" or not tickers:
+                return None
+            ticker = tickers[0]
+            ts = ticker.get("ts")
+            return arg.get("instId"), float(ticker["lastPr"]), int(ts) if ts else None
+
+        return self._ws_hub(
+            "spotTicker",
+            url=self.get_ws_url(),
+            subscribe=lambda inst_ids: frame("subscribe", inst_ids),
+            unsubscribe=lambda inst_ids: frame("unsubscribe", inst_ids),
+            route=route,
+            ping="ping",
+        )
+
     async def _fetch_spot_price(self, symbol: str) -> float | None:
         """Fetch current spot price."""
         session = await self._ensure_session()
@@ -226,12 +255,19 @@ class BitgetClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", [{}])[0].get("lastPr"))
         except Exception:
             return None
 
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
+    async def _fetch_spot_prices(self) -> dict[str, float]:
+        """Fetch spot prices for all symbols."""
+        session = await self._ensure_session()
+        url = f"{self.get_base_url()}/v2/spot/market/public/tickers"
+
+        async with session.get(url) as resp:
+            if resp.status != 200:
+                await reject_response(resp, "Failed to fetch spot prices")
+            data = await read_json(resp)
+
+        return {item["symbol"]: float(item["lastPr"]) for item in data.get("data", [])}
@@ -2,24 +2,39 @@
 
 from __future__ import annotations
 
-import hashlib
 import hmac
-import json
 import logging
-import time
-from typing import Any
-from urllib.parse import urlencode
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import BaseExchangeClient, ProxyConfig, json_dumps, now_ms, read_json, reject_response
 from .protocol import Balance, Order
 
+_RECV_WINDOW = "5000"
+
+
+def _make_signer(template: hmac.HMAC, api_key: str) -> Callable[..., tuple[str, str]]:
+    """Build a Bybit request signer closed over the key and HMAC template.
+
+    The signer runs for every private call; closure cells are cheaper to
+    read than instance attributes, which keeps lookups off that path.
+    Parameter values are symbols, sides, categories and numbers, which
+    urlencode would pass through unchanged, so the query is joined
+    directly.
+    """
+    prefix = api_key + _RECV_WINDOW
+    copy = template.copy
+
+    def sign(method: str, path: str, params: dict[str, Any] | None = None) -> tuple[str, str]:
+        timestamp = str(now_ms())
+        param_str = "&".join([f"{k}={v}" for k, v in params.items()]) if params else ""
+        mac = copy()
+        mac.update(f"{timestamp}{prefix}{param_str}".encode())
+        return timestamp, mac.hexdigest()
+
+    return sign
+
 
 class BybitClient(BaseExchangeClient):
     """Bybit exchange client."""
@@ -43,7 +58,12 @@ class BybitClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._sign_request = _make_signer(self._hmac_template, api_key)
+        self._header_template = {
+            "X-BAPI-API-KEY": api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
@@ -55,34 +75,11 @@ class BybitClient(BaseExchangeClient):
             return "wss://stream-testnet.bybit.com/v5/public/spot"
         return "wss://stream.bybit.com/v5/public/spot"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for Bybit adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self, timestamp: str, signature: str) -> dict[str, str]:
-        return {
-            "X-BAPI-API-KEY": self.api_key,
-            "X-BAPI-TIMESTAMP": timestamp,
-            "X-BAPI-SIGN": signature,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
-
-    def _sign_request(self, method: str, path: str, params: dict[str, Any] | None = None) -> tuple[str, str]:
-        """Generate Bybit signature."""
-        timestamp = str(int(time.time() * 1000))
-        param_str = urlencode(params or {})
-        message = timestamp + self.api_key + str(5000) + param_str
-        signature = hmac.new(
-            self.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        return timestamp, signature
+        headers = self._header_template.copy()
+        headers["X-BAPI-TIMESTAMP"] = timestamp
+        headers["X-BAPI-SIGN"] = signature
+        return headers
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
         """Fetch account balance."""
@@ -95,24 +92,22 @@ class BybitClient(BaseExchangeClient):
         headers = self._get_headers(timestamp, signature)
         async with session.get(url, params=params, headers=headers) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
-        balances = []
+        by_asset: dict[str, Balance] = {}
         for coin in data.get("result", {}).get("list", [{}])[0].get("coin", []):
             curr = coin.get("coin")
             free = float(coin.get("walletBalance", 0))
             locked = float(coin.get("lockedInStake", 0))
             if free > 0 or locked > 0:
-                balances.append(Balance(curr, free, locked))
+                by_asset[curr.upper()] = Balance(curr, free, locked)
 
         if asset:
-            for b in balances:
-                if b.asset.upper() == asset.upper():
-                    return b
-            return Balance(asset.upper(), 0, 0)
+            wanted = asset.upper()
+            return by_asset.get(wanted) or Balance(wanted, 0, 0)
 
-        return balances
+        return list(by_asset.values())
 
     async def place_market_order(
         self,
@@ -121,12 +116,13 @@ class BybitClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        symbol = symbol.upper()
         session = await self._ensure_session()
         path = "/v5/order/create"
 
         params = {
             "category": "spot",
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "side": side.upper(),
             "orderType": "Market",
             "qty": str(quantity),
@@ -136,15 +132,15 @@ class BybitClient(BaseExchangeClient):
         url = f"{self.get_base_url()}{path}"
         headers = self._get_headers(timestamp, signature)
 
-        async with session.post(url, json=params, headers=headers) as resp:
+        async with session.post(url, data=json_dumps(params), headers=headers) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_data = data.get("result", {})
         return Order(
             order_data.get("orderId"),
-            symbol.upper(),
+            symbol,
             side.lower(),
             quantity,
             0.0,
@@ -156,12 +152,13 @@ class BybitClient(BaseExchangeClient):
         if not symbol:
             raise ValueError("Bybit requires symbol to cancel order")
 
+        symbol = symbol.upper()
         session = await self._ensure_session()
         path = "/v5/order/cancel"
 
         params = {
             "category": "spot",
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "orderId": order_id,
         }
 
@@ -169,15 +166,15 @@ class BybitClient(BaseExchangeClient):
         url = f"{self.get_base_url()}{path}"
         headers = self._get_headers(timestamp, signature)
 
-        async with session.post(url, json=params, headers=headers) as resp:
+        async with session.post(url, data=json_dumps(params), headers=headers) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         order_data = data.get("result", {})
         return Order(
             order_id,
-            symbol.upper(),
+            symbol,
             "",
             0,
             0.0,
@@ -203,9 +200,9 @@ class BybitClient(BaseExchangeClient):
         url = f"{self.get_base_url()}{path}"
         headers = self._get_headers(timestamp, signature)
 
-        async with session.post(url, json=params, headers=headers) as resp:
+        async with session.post(url, data=json_dumps(params), headers=headers) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -217,7 +214,7 @@ class BybitClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 result = data.get("result", {}).get("list", [])
                 if result:
                     return float(result[0][1])
@@ -235,12 +232,7 @@ class BybitClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("result", {}).get("list", [{}])[0].get("lastPrice"))
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
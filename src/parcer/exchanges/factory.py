@@ -2,33 +2,62 @@
 
 from __future__ import annotations
 
-from typing import Any, Type
+import importlib
+from typing import Any, Iterator, Mapping, Type
 
 from .base import BaseExchangeClient, ProxyConfig
-from .binance import BinanceClient
-from .okx import OKXClient
-from .bybit import BybitClient
-from .bitget import BitgetClient
-from .gate import GateClient
-from .kucoin import KuCoinClient
-from .mexc import MEXCClient
-from .htx import HTXClient
-from .bingx import BingXClient
-from .xt import XTClient
-
-
-EXCHANGE_CLIENTS: dict[str, Type[BaseExchangeClient]] = {
-    "binance": BinanceClient,
-    "okx": OKXClient,
-    "bybit": BybitClient,
-    "bitget": BitgetClient,
-    "gate": GateClient,
-    "kucoin": KuCoinClient,
-    "mexc": MEXCClient,
-    "htx": HTXClient,
-    "bingx": BingXClient,
-    "xt": XTClient,
-}
+
+
+class _LazyClientRegistry(Mapping[str, Type[BaseExchangeClient]]):
+    """Read-only exchange name -> client class mapping.
+
+    Adapter modules are imported on first lookup, so a process pays only
+    for the exchanges it actually configures. Membership, iteration and
+    ``len`` never import anything.
+    """
+
+    def __init__(self, paths: Mapping[str, str]):
+        self._paths = dict(paths)
+        self._loaded: dict[str, Type[BaseExchangeClient]] = {}
+
+    def __getitem__(self, name: str) -> Type[BaseExchangeClient]:
+        try:
+            return self._loaded[name]
+        except KeyError:
+            module_name, _, class_name = self._paths[name].partition(":")
+            client_class = getattr(importlib.import_module(module_name, __package__), class_name)
+            self._loaded[name] = client_class
+            return client_class
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._paths
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._paths)
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({list(self._paths)!r})"
+
+
+EXCHANGE_CLIENTS: Mapping[str, Type[BaseExchangeClient]] = _LazyClientRegistry({
+    "binance": ".binance:BinanceClient",
+    "okx": ".okx:OKXClient",
+    "bybit": ".bybit:BybitClient",
+    "bitget": ".bitget:BitgetClient",
+    "gate": ".gate:GateClient",
+    "kucoin": ".kucoin:KuCoinClient",
+    "mexc": ".mexc:MEXCClient",
+    "htx": ".htx:HTXClient",
+    "bingx": ".bingx:BingXClient",
+    "xt": ".xt:XTClient",
+})
+
+_SUPPORTED_EXCHANGES = ", ".join(EXCHANGE_CLIENTS)
+
+_REQUIRES_PASSPHRASE = frozenset({"okx", "kucoin", "bitget"})
 
 
 def create_exchange_client(
@@ -62,9 +91,8 @@ def create_exchange_client(
     exchange_lower = exchange.lower()
 
     if exchange_lower not in EXCHANGE_CLIENTS:
-        supported = ", ".join(EXCHANGE_CLIENTS.keys())
         raise ValueError(
-            f"Unsupported exchange: {exchange}. Supported exchanges: {supported}"
+            f"Unsupported exchange: {exchange}. Supported exchanges: {_SUPPORTED_EXCHANGES}"
         )
 
     client_class = EXCHANGE_CLIENTS[exchange_lower]
@@ -77,8 +105,7 @@ def create_exchange_client(
             password=proxy.get("password"),
         )
 
-    requires_passphrase = exchange_lower in {"okx", "kucoin", "bitget"}
-    if requires_passphrase and not passphrase:
+    if exchange_lower in _REQUIRES_PASSPHRASE and not passphrase:
         raise ValueError(f"{exchange} requires passphrase parameter")
 
     kwargs = {
@@ -2,24 +2,32 @@
 
 from __future__ import annotations
 
-import hashlib
 import hmac
-import json
 import logging
-import time
-from typing import Any
+from typing import Any, Callable
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import BaseExchangeClient, ProxyConfig, json_dumps, now_s, read_json, reject_response
 from .protocol import Balance, Order
 
 
+def _make_signer(template: hmac.HMAC) -> Callable[..., tuple[str, str]]:
+    """Build a Gate.io request signer closed over the HMAC-SHA512 template.
+
+    The signature covers the exact body bytes sent.
+    """
+    copy = template.copy
+
+    def sign(method: str, path: str, body: bytes = b"") -> tuple[str, str]:
+        timestamp = str(now_s())
+        mac = copy()
+        mac.update(b"\n".join([method.encode(), path.encode(), body, timestamp.encode()]))
+        return mac.hexdigest(), timestamp
+
+    return sign
+
+
 class GateClient(BaseExchangeClient):
     """Gate.io exchange client."""
 
@@ -40,7 +48,12 @@ class GateClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._sign_request = _make_signer(hmac.new(api_secret.encode(), digestmod="sha512"))
+        self._header_template = {
+            "KEY": api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
@@ -52,33 +65,11 @@ class GateClient(BaseExchangeClient):
             return "wss://api.gateio.ws/ws/v4/"
         return "wss://api.gateio.ws/ws/v4/"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for Gate adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self, signature: str, timestamp: str) -> dict[str, str]:
-        return {
-            "KEY": self.api_key,
-            "Timestamp": timestamp,
-            "SIGN": signature,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
-
-    def _sign_request(self, method: str, path: str, body: str = "") -> tuple[str, str]:
-        """Generate Gate.io signature."""
-        timestamp = str(int(time.time()))
-        message = "\n".join([method, path, body, timestamp])
-        signature = hmac.new(
-            self.api_secret.encode(),
-            message.encode(),
-            hashlib.sha512,
-        ).hexdigest()
-        return signature, timestamp
+        headers = self._header_template.copy()
+        headers["Timestamp"] = timestamp
+        headers["SIGN"] = signature
+        return headers
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
         """Fetch account balance."""
@@ -89,25 +80,28 @@ class GateClient(BaseExchangeClient):
 
         async with session.get(url, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
-        balances = []
+        by_asset: dict[str, Balance] = {}
         for account in data:
             for balance_item in account.get("balances", []):
                 curr = balance_item.get("currency")
                 free = float(balance_item.get("available", 0))
                 locked = float(balance_item.get("locked", 0))
                 if free > 0 or locked > 0:
-                    balances.append(Balance(curr, free, locked))
+                    existing = by_asset.get(curr.upper())
+                    if existing:
+                        existing.free += free
+                        existing.used += locked
+                    else:
+                        by_asset[curr.upper()] = Balance(curr, free, locked)
 
         if asset:
-            for b in balances:
-                if b.asset.upper() == asset.upper():
-                    return b
-            return Balance(asset.upper(), 0, 0)
+            wanted = asset.upper()
+            return by_asset.get(wanted) or Balance(wanted, 0, 0)
 
-        return balances
+        return list(by_asset.values())
 
     async def place_market_order(
         self,
@@ -116,12 +110,14 @@ class GateClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        symbol = symbol.upper()
+        side = side.lower()
         session = await self._ensure_session()
         path = "/api/v4/spot/orders"
 
-        body = json.dumps({
-            "currency_pair": symbol.upper(),
-            "side": side.lower(),
+        body = json_dumps({
+            "currency_pair": symbol,
+            "side": side,
             "amount": str(quantity),
             "type": "market",
         })
@@ -131,13 +127,13 @@ class GateClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         return Order(
             str(data.get("id")),
-            symbol.upper(),
-            side.lower(),
+            symbol,
+            side,
             quantity,
             0.0,
             data.get("status", "").lower(),
@@ -156,8 +152,8 @@ class GateClient(BaseExchangeClient):
 
         async with session.delete(url, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         return Order(
             order_id,
@@ -176,7 +172,7 @@ class GateClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/api/v4/futures/usdt/positions"
 
-        body = json.dumps({
+        body = json_dumps({
             "contract": symbol.lower() + "_usdt",
             "leverage": str(int(leverage)),
         })
@@ -186,7 +182,7 @@ class GateClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -198,7 +194,7 @@ class GateClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 if data:
                     return float(data[0].get("mark_price"))
                 return None
@@ -215,14 +211,9 @@ class GateClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 if data:
                     return float(data[0].get("last"))
                 return None
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
@@ -4,23 +4,41 @@ from __future__ import annotations
 
 import hashlib
 import hmac
-import json
 import logging
-import time
-from typing import Any
-from urllib.parse import urlencode
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
 import base64
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from ..paths import CACHE_DIR as _CACHE_DIR
+from .base import BaseExchangeClient, ProxyConfig, json_dumps, now_s, read_json, reject_response
 from .protocol import Balance, Order
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _make_signer(template: hmac.HMAC, auth_params: dict[str, str]) -> Callable[[str, str], dict[str, Any]]:
+    """Build a signer returning the authentication query for a request.
+
+    Only the timestamp varies, and "Timestamp" sorts after every fixed
+    parameter name, so the sorted payload is the prebuilt fixed part
+    followed by the timestamp line.
+    """
+    auth_payload = "\n".join(f"{key}={value}" for key, value in sorted(auth_params.items()))
+    copy = template.copy
+    b64encode = base64.b64encode
+
+    def signed_params(method: str, path: str) -> dict[str, Any]:
+        timestamp = now_s()
+        mac = copy()
+        mac.update(f"{method}\napi.huobi.pro\n{path}\n{auth_payload}\nTimestamp={timestamp}".encode())
+        return {**auth_params, "Timestamp": timestamp, "Signature": b64encode(mac.digest()).decode()}
+
+    return signed_params
+
 
 class HTXClient(BaseExchangeClient):
     """HTX (Huobi) exchange client."""
@@ -42,56 +60,56 @@ class HTXClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
-        self.account_id = None
+        self.account_id = options.get("account_id")
+        self._account_id_file = (
+            _CACHE_DIR / f"htx-account-{hashlib.sha256(api_key.encode()).hexdigest()[:16]}"
+            if options.get("cache_account_id")
+            else None
+        )
+        self._auth_params = {
+            "AccessKeyId": api_key,
+            "SignatureMethod": "HmacSHA256",
+            "SignatureVersion": "2",
+        }
+        self._signed_params = _make_signer(self._hmac_template, self._auth_params)
 
     def get_base_url(self) -> str:
         if self.sandbox:
             return "https://api.huobi.pro"
         return "https://api.huobi.pro"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for HTX adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
-    def _get_signature(self, method: str, path: str, params: dict[str, Any]) -> str:
-        """Generate HTX signature."""
-        payload = "\n".join([method, "api.huobi.pro", path])
-        sorted_params = sorted(params.items())
-        for key, value in sorted_params:
-            payload += f"\n{key}={value}"
-
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode(),
-                payload.encode(),
-                hashlib.sha256,
-            ).digest()
-        ).decode()
-        return signature
+    async def connect(self) -> None:
+        """Open the session and resolve the account ID ahead of trading."""
+        await super().connect()
+        await self._ensure_account_id()
+
+    async def _ensure_account_id(self) -> str:
+        """Return the spot account ID, looking it up only once.
+
+        The ID comes from the ``account_id`` option, then (with the
+        ``cache_account_id`` option) from a per-API-key cache file, and only
+        then from the accounts endpoint.
+        """
+        if not self.account_id and self._account_id_file is not None:
+            try:
+                self.account_id = self._account_id_file.read_text(encoding="utf-8").strip() or None
+            except OSError:
+                pass
+        if not self.account_id:
+            await self._discover_account_id()
+        return self.account_id
 
-    async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
-        """Fetch account balance."""
+    async def _discover_account_id(self) -> None:
+        """Fetch the account ID from the accounts endpoint."""
         session = await self._ensure_session()
         path = "/v1/account/accounts"
-        params = {
-            "AccessKeyId": self.api_key,
-            "SignatureMethod": "HmacSHA256",
-            "SignatureVersion": "2",
-            "Timestamp": int(time.time()),
-        }
-        signature = self._get_signature("GET", path, params)
-        params["Signature"] = signature
+        params = self._signed_params("GET", path)
 
         url = f"{self.get_base_url()}{path}"
         async with session.get(url, params=params) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch accounts: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch accounts")
+            data = await read_json(resp)
 
         accounts = data.get("data", [])
         if accounts:
@@ -100,23 +118,39 @@ class HTXClient(BaseExchangeClient):
         if not self.account_id:
             raise Exception("No account ID found")
 
-        path = f"/v1/account/accounts/{self.account_id}/balance"
-        params = {
-            "AccessKeyId": self.api_key,
-            "SignatureMethod": "HmacSHA256",
-            "SignatureVersion": "2",
-            "Timestamp": int(time.time()),
-        }
-        signature = self._get_signature("GET", path, params)
-        params["Signature"] = signature
+        if self._account_id_file is not None:
+            self._store_account_id(self._account_id_file, str(self.account_id))
+
+    @staticmethod
+    def _store_account_id(cache_file: Path, account_id: str) -> None:
+        try:
+            cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=cache_file.parent, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as f:
+                    f.write(account_id)
+                os.replace(tmp, cache_file)
+            except BaseException:
+                os.unlink(tmp)
+                raise
+        except OSError as e:
+            logger.debug("Could not cache HTX account ID: %s", e)
+
+    async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
+        """Fetch account balance."""
+        account_id = await self._ensure_account_id()
+        session = await self._ensure_session()
+
+        path = f"/v1/account/accounts/{account_id}/balance"
+        params = self._signed_params("GET", path)
 
         url = f"{self.get_base_url()}{path}"
         async with session.get(url, params=params) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
-        balances = []
+        by_asset: dict[str, Balance] = {}
         for list_item in data.get("data", {}).get("list", []):
             curr = list_item.get("currency").upper()
             balance_type = list_item.get("type")
@@ -132,20 +166,18 @@ class HTXClient(BaseExchangeClient):
                 continue
 
             if free > 0 or locked > 0:
-                existing = next((b for b in balances if b.asset == curr), None)
+                existing = by_asset.get(curr)
                 if existing:
                     existing.free += free
                     existing.used += locked
                 else:
-                    balances.append(Balance(curr, free, locked))
+                    by_asset[curr] = Balance(curr, free, locked)
 
         if asset:
-            for b in balances:
-                if b.asset.upper() == asset.upper():
-                    return b
-            return Balance(asset.upper(), 0, 0)
+            wanted = asset.upper()
+            return by_asset.get(wanted) or Balance(wanted, 0, 0)
 
-        return balances
+        return list(by_asset.values())
 
     async def place_market_order(
         self,
@@ -154,39 +186,31 @@ class HTXClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        side = side.lower()
+        account_id = await self._ensure_account_id()
         session = await self._ensure_session()
 
-        if not self.account_id:
-            await self.get_balance()
-
         path = "/v1/order/orders/place"
         body = {
-            "account-id": str(self.account_id),
+            "account-id": str(account_id),
             "symbol": symbol.lower(),
-            "type": f"{side.lower()}-market",
+            "type": f"{side}-market",
             "amount": str(quantity),
         }
 
-        params = {
-            "AccessKeyId": self.api_key,
-            "SignatureMethod": "HmacSHA256",
-            "SignatureVersion": "2",
-            "Timestamp": int(time.time()),
-        }
-        signature = self._get_signature("POST", path, params)
-        params["Signature"] = signature
+        params = self._signed_params("POST", path)
 
         url = f"{self.get_base_url()}{path}"
-        async with session.post(url, json=body, params=params) as resp:
+        async with session.post(url, data=json_dumps(body), params=params, headers=_JSON_HEADERS) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_id = data.get("data")
         return Order(
             str(order_id),
             symbol.upper(),
-            side.lower(),
+            side,
             quantity,
             0.0,
             "submitted",
@@ -197,20 +221,13 @@ class HTXClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = f"/v1/order/orders/{order_id}/submitcancel"
 
-        params = {
-            "AccessKeyId": self.api_key,
-            "SignatureMethod": "HmacSHA256",
-            "SignatureVersion": "2",
-            "Timestamp": int(time.time()),
-        }
-        signature = self._get_signature("POST", path, params)
-        params["Signature"] = signature
+        params = self._signed_params("POST", path)
 
         url = f"{self.get_base_url()}{path}"
         async with session.post(url, params=params) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         return Order(
             order_id,
@@ -231,7 +248,7 @@ class HTXClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 tick = data.get("tick", {})
                 trades = tick.get("data", [])
                 if trades:
@@ -239,8 +256,3 @@ class HTXClient(BaseExchangeClient):
                 return None
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
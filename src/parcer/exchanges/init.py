@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from typing import Dict
 
+from .base import BaseExchangeClient, SharedSession
 from .factory import create_exchange_client
 from .protocol import ExchangeClient
 from ..settings import Settings
@@ -12,9 +14,18 @@ from ..settings import Settings
 logger = logging.getLogger(__name__)
 
 
-def create_exchange_clients_from_settings(settings: Settings) -> Dict[str, ExchangeClient]:
-    """Create exchange clients from settings configuration."""
+def create_exchange_clients_from_settings(
+    settings: Settings,
+    session: SharedSession | None = None,
+) -> Dict[str, ExchangeClient]:
+    """Create exchange clients from settings configuration.
+
+    All clients share one HTTP session and connection pool, ``session`` or
+    a new one; release it with ``close_all``.
+    """
     clients: Dict[str, ExchangeClient] = {}
+    if session is None:
+        session = SharedSession()
     
     for exchange_name, exchange_config in settings.exchanges.items():
         if not exchange_config.enabled:
@@ -32,6 +43,7 @@ def create_exchange_clients_from_settings(settings: Settings) -> Dict[str, Excha
                 api_secret=exchange_config.credentials.api_secret.get_secret_value(),
                 passphrase=exchange_config.credentials.passphrase.get_secret_value() if exchange_config.credentials.passphrase else None,
                 sandbox=exchange_config.sandbox,
+                session=session,
                 **exchange_config.options,
             )
             clients[exchange_name] = client
@@ -41,4 +53,39 @@ def create_exchange_clients_from_settings(settings: Settings) -> Dict[str, Excha
             logger.error("Failed to initialize exchange client for %s: %s", exchange_name, e)
             continue
     
-    return clients
\ No newline at end of file
+    return clients
+
+
+async def connect_exchange_clients(clients: Dict[str, ExchangeClient]) -> None:
+    """Connect exchange clients concurrently.
+
+    Startup then costs the slowest client rather than the sum of all of them.
+    Failures are logged and left for the first real request to surface.
+    """
+
+    async def _connect(exchange_name: str, client: BaseExchangeClient) -> None:
+        try:
+            await client.connect()
+        except Exception as e:
+            logger.warning("Failed to connect exchange client for %s: %s", exchange_name, e)
+
+    await asyncio.gather(
+        *(
+            _connect(exchange_name, client)
+            for exchange_name, client in clients.items()
+            if isinstance(client, BaseExchangeClient)
+        )
+    )
+
+
+async def close_all(clients: Dict[str, ExchangeClient]) -> None:
+    """Close every client, then each shared session they use, once."""
+    adapters = [client for client in clients.values() if isinstance(client, BaseExchangeClient)]
+    results = await asyncio.gather(*(client.close() for client in adapters), return_exceptions=True)
+    for client, result in zip(adapters, results):
+        if isinstance(result, Exception):
+            logger.warning("Failed to close exchange client for %s: %s", client.name, result)
+
+    shared = {id(client.shared_session): client.shared_session for client in adapters if client.shared_session}
+    for session in shared.values():
+        await session.close()
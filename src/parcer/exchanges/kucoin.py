@@ -3,21 +3,20 @@
 from __future__ import annotations
 
 import base64
-import hashlib
-import hmac
-import json
 import logging
-import time
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import (
+    ZERO_AMOUNTS,
+    BaseExchangeClient,
+    ProxyConfig,
+    json_dumps,
+    now_ms,
+    read_json,
+    reject_response,
+)
 from .protocol import Balance, Order
 
 
@@ -43,7 +42,13 @@ class KuCoinClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._header_template = {
+            "KC-API-KEY": api_key,
+            "KC-API-KEY-VERSION": "1",
+            "KC-API-PASSPHRASE": passphrase,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
@@ -55,36 +60,17 @@ class KuCoinClient(BaseExchangeClient):
             return "wss://ws-sandbox.kucoin.com/socket.io"
         return "wss://ws.kucoin.com/socket.io"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for KuCoin adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self, signature: str, timestamp: str, nonce: str) -> dict[str, str]:
-        return {
-            "KC-API-KEY": self.api_key,
-            "KC-API-SIGN": signature,
-            "KC-API-TIMESTAMP": timestamp,
-            "KC-API-KEY-VERSION": "1",
-            "KC-API-PASSPHRASE": self.passphrase,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
-
-    def _sign_request(self, method: str, path: str, body: str = "") -> tuple[str, str, str]:
-        """Generate KuCoin signature."""
-        nonce = str(int(time.time() * 1000))
-        message = nonce + method + path + body
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256,
-            ).digest()
-        ).decode()
+        headers = self._header_template.copy()
+        headers["KC-API-SIGN"] = signature
+        headers["KC-API-TIMESTAMP"] = timestamp
+        return headers
+
+    def _sign_request(self, method: str, path: str, body: bytes = b"") -> tuple[str, str, str]:
+        """Generate KuCoin signature over the exact body bytes sent."""
+        nonce = str(now_ms())
+        message = f"{nonce}{method}{path}".encode() + body
+        signature = base64.b64encode(self._hmac(message).digest()).decode()
         return signature, nonce, nonce
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
@@ -96,23 +82,29 @@ class KuCoinClient(BaseExchangeClient):
 
         async with session.get(url, headers=self._get_headers(signature, timestamp, nonce)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
         balances = []
+        append = balances.append
         for item in data.get("data", []):
-            if item.get("type") == "trade":
-                curr = item.get("currency")
-                free = float(item.get("available", 0))
-                locked = float(item.get("holds", 0))
-                if free > 0 or locked > 0:
-                    balances.append(Balance(curr, free, locked))
+            if item.get("type") != "trade":
+                continue
+            free = item.get("available", 0)
+            locked = item.get("holds", 0)
+            if free in ZERO_AMOUNTS and locked in ZERO_AMOUNTS:
+                continue
+            free = float(free)
+            locked = float(locked)
+            if free > 0 or locked > 0:
+                append(Balance(item.get("currency"), free, locked))
 
         if asset:
+            wanted = asset.upper()
             for b in balances:
-                if b.asset.upper() == asset.upper():
+                if b.asset.upper() == wanted:
                     return b
-            return Balance(asset.upper(), 0, 0)
+            return Balance(wanted, 0, 0)
 
         return balances
 
@@ -123,12 +115,14 @@ class KuCoinClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        symbol = symbol.upper()
+        side = side.lower()
         session = await self._ensure_session()
         path = "/api/v1/orders"
 
-        body = json.dumps({
-            "symbol": symbol.upper(),
-            "side": side.lower(),
+        body = json_dumps({
+            "symbol": symbol,
+            "side": side,
             "size": str(quantity),
             "type": "market",
         })
@@ -138,14 +132,14 @@ class KuCoinClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp, nonce)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_data = data.get("data", {})
         return Order(
             order_data.get("orderId"),
-            symbol.upper(),
-            side.lower(),
+            symbol,
+            side,
             quantity,
             0.0,
             "new",
@@ -161,8 +155,8 @@ class KuCoinClient(BaseExchangeClient):
 
         async with session.delete(url, headers=self._get_headers(signature, timestamp, nonce)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         order_data = data.get("data", {})
         return Order(
@@ -182,7 +176,7 @@ class KuCoinClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/api/v1/position/updateLeverage"
 
-        body = json.dumps({
+        body = json_dumps({
             "symbol": symbol.upper(),
             "leverage": int(leverage),
         })
@@ -192,7 +186,7 @@ class KuCoinClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp, nonce)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -203,7 +197,7 @@ class KuCoinClient(BaseExchangeClient):
             async with session.get(url) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", {}).get("markPrice"))
         except Exception:
             return None
@@ -218,12 +212,7 @@ class KuCoinClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", {}).get("price"))
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
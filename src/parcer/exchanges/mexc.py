@@ -2,22 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
-import hmac
 import json
 import logging
-import time
 from typing import Any
-from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import ZERO_AMOUNTS, BaseExchangeClient, ProxyConfig, now_ms, read_json, reject_response
 from .protocol import Balance, Order
 
 
@@ -41,62 +32,62 @@ class MEXCClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._headers = {
+            "X-MEXC-APIKEY": api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
             return "https://api-sandbox.mexc.com"
         return "https://api.mexc.com"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for MEXC adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self) -> dict[str, str]:
-        return {
-            "X-MEXC-APIKEY": self.api_key,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
+        # aiohttp copies request headers, so the same dict can be passed every time
+        return self._headers
 
     def _sign_params(self, params: dict[str, Any]) -> dict[str, Any]:
-        """Add signature to params."""
-        params = dict(params)
-        query_string = urlencode(params)
-        signature = hmac.new(
-            self.api_secret.encode(),
-            query_string.encode(),
-            hashlib.sha256,
-        ).hexdigest()
-        params["signature"] = signature
+        """Add signature to params, in place.
+
+        Callers build a fresh dict per request, so it is signed and returned
+        without copying. MEXC verifies the query string exactly as sent; the
+        values are symbols, sides, order IDs and numbers, which urlencode
+        would pass through unchanged, so the query is joined directly.
+        """
+        query_string = "&".join([f"{k}={v}" for k, v in params.items()])
+        params["signature"] = self._hmac(query_string).hexdigest()
         return params
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
         """Fetch account balance."""
         session = await self._ensure_session()
         url = f"{self.get_base_url()}/api/v3/account"
-        params = self._sign_params({"timestamp": int(time.time() * 1000)})
+        params = self._sign_params({"timestamp": now_ms()})
 
         async with session.get(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
-
-        balances = [
-            Balance(b["asset"], float(b["free"]), float(b["locked"]))
-            for b in data.get("balances", [])
-            if float(b["free"]) > 0 or float(b["locked"]) > 0
-        ]
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
+
+        balances = []
+        append = balances.append
+        for item in data.get("balances", []):
+            free = item["free"]
+            locked = item["locked"]
+            if free in ZERO_AMOUNTS and locked in ZERO_AMOUNTS:
+                continue
+            free = float(free)
+            locked = float(locked)
+            if free > 0 or locked > 0:
+                append(Balance(item["asset"], free, locked))
 
         if asset:
+            wanted = asset.upper()
             for b in balances:
-                if b.asset.upper() == asset.upper():
+                if b.asset.upper() == wanted:
                     return b
-            return Balance(asset.upper(), 0, 0)
+            return Balance(wanted, 0, 0)
 
         return balances
 
@@ -114,13 +105,13 @@ class MEXCClient(BaseExchangeClient):
             "side": side.upper(),
             "type": "MARKET",
             "quantity": quantity,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": now_ms(),
         })
 
         async with session.post(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         return Order(
             str(data["orderId"]),
@@ -141,13 +132,13 @@ class MEXCClient(BaseExchangeClient):
         params = self._sign_params({
             "symbol": symbol.upper(),
             "orderId": order_id,
-            "timestamp": int(time.time() * 1000),
+            "timestamp": now_ms(),
         })
 
         async with session.delete(url, params=params, headers=self._get_headers()) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         return Order(
             str(data["orderId"]),
@@ -168,12 +159,7 @@ class MEXCClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("price"))
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
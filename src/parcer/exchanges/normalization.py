@@ -3,11 +3,21 @@
 from __future__ import annotations
 
 import logging
+from functools import lru_cache
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
+# Stablecoin quotes recognized in concatenated symbols, longest first so that
+# a longer quote wins over any shorter one it ends with.
+_STABLECOIN_QUOTES = ("USDT", "USDC", "BUSD", "TUSD", "USDD", "DAI")
 
+# Trading code normalizes the same few hundred symbols over and over, so
+# both parsers below are memoized; this bounds the cache per function.
+_SYMBOL_CACHE_SIZE = 4096
+
+
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def normalize_symbol(symbol: str, format: str = "unified") -> str:
     """Normalize a symbol to a standard format.
 
@@ -47,6 +57,7 @@ def normalize_symbol(symbol: str, format: str = "unified") -> str:
         return unified
 
 
+@lru_cache(maxsize=_SYMBOL_CACHE_SIZE)
 def extract_base_symbol(symbol: str) -> tuple[str, str]:
     """Extract base and quote currency from a symbol.
 
@@ -77,8 +88,7 @@ def extract_base_symbol(symbol: str) -> tuple[str, str]:
         if len(parts) == 2:
             return parts[0].strip(), parts[1].strip()
 
-    usdt_stablecoins = {"USDT", "USDC", "BUSD", "DAI", "TUSD", "USDD"}
-    for stablecoin in sorted(usdt_stablecoins, key=len, reverse=True):
+    for stablecoin in _STABLECOIN_QUOTES:
         if symbol.endswith(stablecoin):
             base = symbol[: -len(stablecoin)]
             if base:
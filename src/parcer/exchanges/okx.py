@@ -3,21 +3,12 @@
 from __future__ import annotations
 
 import base64
-import hashlib
-import hmac
-import json
 import logging
-import time
 from typing import Any
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import ZERO_AMOUNTS, BaseExchangeClient, ProxyConfig, json_dumps, now_s, read_json, reject_response
 from .protocol import Balance, Order
 
 
@@ -43,7 +34,12 @@ class OKXClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._header_template = {
+            "OK-ACCESS-KEY": api_key,
+            "OK-ACCESS-PASSPHRASE": passphrase,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
@@ -55,35 +51,17 @@ class OKXClient(BaseExchangeClient):
             return "wss://wspap.okx.com:8443/ws/v5/public"
         return "wss://ws.okx.com:8443/ws/v5/public"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for OKX adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self, timestamp: str, signature: str) -> dict[str, str]:
-        return {
-            "OK-ACCESS-KEY": self.api_key,
-            "OK-ACCESS-SIGN": signature,
-            "OK-ACCESS-TIMESTAMP": timestamp,
-            "OK-ACCESS-PASSPHRASE": self.passphrase,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
-
-    def _sign_request(self, method: str, path: str, body: str = "") -> tuple[str, str]:
-        """Generate OKX signature."""
-        timestamp = str(int(time.time()))
-        message = timestamp + method + path + body
-        signature = base64.b64encode(
-            hmac.new(
-                self.api_secret.encode(),
-                message.encode(),
-                hashlib.sha256,
-            ).digest()
-        ).decode()
+        headers = self._header_template.copy()
+        headers["OK-ACCESS-SIGN"] = signature
+        headers["OK-ACCESS-TIMESTAMP"] = timestamp
+        return headers
+
+    def _sign_request(self, method: str, path: str, body: bytes = b"") -> tuple[str, str]:
+        """Generate OKX signature over the exact body bytes sent."""
+        timestamp = str(now_s())
+        message = f"{timestamp}{method}{path}".encode() + body
+        signature = base64.b64encode(self._hmac(message).digest()).decode()
         return timestamp, signature
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
@@ -95,22 +73,29 @@ class OKXClient(BaseExchangeClient):
 
         async with session.get(url, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
+        # OKX leaves amounts it does not track as "" and may return an empty
+        # data list, so both are read as empty rather than failing float().
         balances = []
-        for detail in data.get("data", [{}])[0].get("details", []):
-            ccy = detail.get("ccy")
-            free = float(detail.get("availBal", 0))
-            locked = float(detail.get("frozenBal", 0))
+        append = balances.append
+        for detail in (data.get("data") or [{}])[0].get("details", []):
+            free = detail.get("availBal") or 0
+            locked = detail.get("frozenBal") or 0
+            if free in ZERO_AMOUNTS and locked in ZERO_AMOUNTS:
+                continue
+            free = float(free)
+            locked = float(locked)
             if free > 0 or locked > 0:
-                balances.append(Balance(ccy, free, locked))
+                append(Balance(detail.get("ccy"), free, locked))
 
         if asset:
+            wanted = asset.upper()
             for b in balances:
-                if b.asset.upper() == asset.upper():
+                if b.asset.upper() == wanted:
                     return b
-            return Balance(asset.upper(), 0, 0)
+            return Balance(wanted, 0, 0)
 
         return balances
 
@@ -121,13 +106,15 @@ class OKXClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        symbol = symbol.upper()
+        side = side.lower()
         session = await self._ensure_session()
         path = "/api/v5/trade/order"
 
-        body = json.dumps({
-            "instId": symbol.upper(),
+        body = json_dumps({
+            "instId": symbol,
             "tdMode": "cash",
-            "side": side.lower(),
+            "side": side,
             "ordType": "market",
             "sz": str(quantity),
         })
@@ -137,14 +124,14 @@ class OKXClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_data = data.get("data", [{}])[0]
         return Order(
             order_data.get("ordId"),
-            symbol.upper(),
-            side.lower(),
+            symbol,
+            side,
             quantity,
             0.0,
             order_data.get("state", "").lower(),
@@ -155,12 +142,13 @@ class OKXClient(BaseExchangeClient):
         if not symbol:
             raise ValueError("OKX requires symbol to cancel order")
 
+        symbol = symbol.upper()
         session = await self._ensure_session()
         path = "/api/v5/trade/cancel-order"
 
-        body = json.dumps({
+        body = json_dumps({
             "ordId": order_id,
-            "instId": symbol.upper(),
+            "instId": symbol,
         })
 
         timestamp, signature = self._sign_request("POST", path, body)
@@ -168,13 +156,13 @@ class OKXClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         order_data = data.get("data", [{}])[0]
         return Order(
             order_id,
-            symbol.upper(),
+            symbol,
             "",
             0,
             0.0,
@@ -189,7 +177,7 @@ class OKXClient(BaseExchangeClient):
         session = await self._ensure_session()
         path = "/api/v5/account/set-leverage"
 
-        body = json.dumps({
+        body = json_dumps({
             "lever": int(leverage),
             "mgnMode": "isolated",
             "instId": symbol.upper(),
@@ -200,7 +188,7 @@ class OKXClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(timestamp, signature)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to set leverage: {resp.status}")
+                await reject_response(resp, "Failed to set leverage")
 
     async def _fetch_mark_price(self, symbol: str) -> float | None:
         """Fetch current mark price."""
@@ -212,7 +200,7 @@ class OKXClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", [{}])[0].get("markPx"))
         except Exception:
             return None
@@ -227,12 +215,7 @@ class OKXClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("data", [{}])[0].get("last"))
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
@@ -2,49 +2,46 @@
 
 from __future__ import annotations
 
+from dataclasses import dataclass
 from typing import AsyncIterator, Protocol, Any
 
 
+# Plain slotted records: adapters build many of these per balance fetch and
+# per price tick, so they carry no per-instance __dict__.
+
+
+@dataclass(slots=True)
 class Balance:
     """Represents account balance for a single asset."""
 
-    def __init__(self, asset: str, free: float, used: float):
-        self.asset = asset
-        self.free = free
-        self.used = used
+    asset: str
+    free: float
+    used: float
 
     @property
     def total(self) -> float:
         return self.free + self.used
 
 
+@dataclass(slots=True)
 class Order:
     """Represents a market order."""
 
-    def __init__(
-        self,
-        order_id: str,
-        symbol: str,
-        side: str,
-        quantity: float,
-        price: float,
-        status: str,
-    ):
-        self.order_id = order_id
-        self.symbol = symbol
-        self.side = side
-        self.quantity = quantity
-        self.price = price
-        self.status = status
+    order_id: str
+    symbol: str
+    side: str
+    quantity: float
+    price: float
+    status: str
 
 
+@dataclass(slots=True)
 class PriceUpdate:
     """Represents a price update (mark price or spot price)."""
 
-    def __init__(self, symbol: str, price: float, timestamp: int | None = None):
-        self.symbol = symbol
-        self.price = price
-        self.timestamp = timestamp
+    symbol: str
+    price: float
+    timestamp: int | None = None
 
 
 class ExchangeClient(Protocol):
@@ -2,22 +2,13 @@
 
 from __future__ import annotations
 
-import hashlib
-import hmac
 import json
 import logging
-import time
 from typing import Any
-from urllib.parse import urlencode
 
 logger = logging.getLogger(__name__)
 
-try:
-    import aiohttp
-except ImportError:
-    aiohttp = None
-
-from .base import BaseExchangeClient, ProxyConfig
+from .base import ZERO_AMOUNTS, BaseExchangeClient, ProxyConfig, now_ms, read_json, reject_response
 from .protocol import Balance, Order
 
 
@@ -41,39 +32,28 @@ class XTClient(BaseExchangeClient):
             proxy=proxy,
             **options,
         )
-        self.session = None
+        self._header_template = {
+            "X-XT-APIKEY": api_key,
+            "Content-Type": "application/json",
+            "User-Agent": "parcer/1.0",
+        }
 
     def get_base_url(self) -> str:
         if self.sandbox:
             return "https://api.xt.com"
         return "https://api.xt.com"
 
-    async def _ensure_session(self) -> aiohttp.ClientSession:
-        if self.session is None:
-            if aiohttp is None:
-                raise ImportError("aiohttp is required for XT adapter")
-            connector = aiohttp.TCPConnector()
-            self.session = aiohttp.ClientSession(connector=connector)
-        return self.session
-
     def _get_headers(self, signature: str, timestamp: str) -> dict[str, str]:
-        return {
-            "X-XT-APIKEY": self.api_key,
-            "X-XT-NONCE": timestamp,
-            "X-XT-SIGNATURE": signature,
-            "Content-Type": "application/json",
-            "User-Agent": "parcer/1.0",
-        }
+        headers = self._header_template.copy()
+        headers["X-XT-NONCE"] = timestamp
+        headers["X-XT-SIGNATURE"] = signature
+        return headers
 
     def _sign_request(self, method: str, path: str, body: str = "") -> tuple[str, str]:
         """Generate XT signature."""
-        timestamp = str(int(time.time() * 1000))
+        timestamp = str(now_ms())
         message = method + path + body + timestamp
-        signature = hmac.new(
-            self.api_secret.encode(),
-            message.encode(),
-            hashlib.sha256,
-        ).hexdigest()
+        signature = self._hmac(message).hexdigest()
         return signature, timestamp
 
     async def get_balance(self, asset: str | None = None) -> list[Balance] | Balance:
@@ -85,22 +65,27 @@ class XTClient(BaseExchangeClient):
 
         async with session.get(url, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to fetch balance: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to fetch balance")
+            data = await read_json(resp)
 
         balances = []
+        append = balances.append
         for item in data.get("result", []):
-            curr = item.get("coin")
-            free = float(item.get("free", 0))
-            locked = float(item.get("locked", 0))
+            free = item.get("free", 0)
+            locked = item.get("locked", 0)
+            if free in ZERO_AMOUNTS and locked in ZERO_AMOUNTS:
+                continue
+            free = float(free)
+            locked = float(locked)
             if free > 0 or locked > 0:
-                balances.append(Balance(curr, free, locked))
+                append(Balance(item.get("coin"), free, locked))
 
         if asset:
+            wanted = asset.upper()
             for b in balances:
-                if b.asset.upper() == asset.upper():
+                if b.asset.upper() == wanted:
                     return b
-            return Balance(asset.upper(), 0, 0)
+            return Balance(wanted, 0, 0)
 
         return balances
 
@@ -111,11 +96,12 @@ class XTClient(BaseExchangeClient):
         quantity: float,
     ) -> Order:
         """Place a market order."""
+        symbol = symbol.upper()
         session = await self._ensure_session()
         path = "/spot/v1/placeOrder"
 
         body = json.dumps({
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "side": side.lower(),
             "type": "market",
             "quantity": str(quantity),
@@ -126,13 +112,13 @@ class XTClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to place order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to place order")
+            data = await read_json(resp)
 
         order_data = data.get("result", {})
         return Order(
             str(order_data.get("orderId")),
-            symbol.upper(),
+            symbol,
             side.lower(),
             quantity,
             0.0,
@@ -144,11 +130,12 @@ class XTClient(BaseExchangeClient):
         if not symbol:
             raise ValueError("XT requires symbol to cancel order")
 
+        symbol = symbol.upper()
         session = await self._ensure_session()
         path = "/spot/v1/cancelOrder"
 
         body = json.dumps({
-            "symbol": symbol.upper(),
+            "symbol": symbol,
             "orderId": order_id,
         })
 
@@ -157,13 +144,13 @@ class XTClient(BaseExchangeClient):
 
         async with session.post(url, data=body, headers=self._get_headers(signature, timestamp)) as resp:
             if resp.status != 200:
-                raise Exception(f"Failed to cancel order: {resp.status}")
-            data = await resp.json()
+                await reject_response(resp, "Failed to cancel order")
+            data = await read_json(resp)
 
         order_data = data.get("result", {})
         return Order(
             order_id,
-            symbol.upper(),
+            symbol,
             "",
             0,
             0.0,
@@ -180,12 +167,7 @@ class XTClient(BaseExchangeClient):
             async with session.get(url, params=params) as resp:
                 if resp.status != 200:
                     return None
-                data = await resp.json()
+                data = await read_json(resp)
                 return float(data.get("result", {}).get("last"))
         except Exception:
             return None
-
-    async def close(self) -> None:
-        """Close connections."""
-        if self.session:
-            await self.session.close()
@@ -2,18 +2,170 @@
 
 from __future__ import annotations
 
+import atexit
 import csv
 import json
 import logging
 import sqlite3
+import threading
+import time
+import weakref
 from datetime import datetime, timedelta, timezone
+from functools import partial
+from itertools import groupby
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Sequence
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 from .orders.position import Position, PositionStatus
 
 logger = logging.getLogger(__name__)
 
+# Applied to every connection. The database itself is switched to WAL once in
+# _init_sqlite (the journal mode persists in the file): readers then never
+# block the writer, and with synchronous=NORMAL a commit appends to the WAL
+# without an fsync, which is deferred to checkpoints.
+_CONNECTION_PRAGMAS = """
+    PRAGMA synchronous = NORMAL;
+    PRAGMA temp_store = MEMORY;
+    PRAGMA cache_size = -20000;
+    PRAGMA mmap_size = 268435456;
+    PRAGMA busy_timeout = 5000;
+"""
+
+# Events are queued and written in one transaction once this many are pending
+# or this many seconds after the first one, whichever comes first.
+_FLUSH_ROWS = 200
+_FLUSH_INTERVAL = 0.05
+
+# Seconds between sweeps of records older than 24h, run at startup and after
+# a batch flush.
+_CLEANUP_INTERVAL = 3600.0
+
+# Database file -> monotonic time of its last sweep, shared by every
+# TradeHistory opened on that file in this process.
+_LAST_CLEANUP: dict[Path, float] = {}
+
+# Column order of trades.csv and of the rows inserted into SQLite.
+_FIELDS = (
+    "timestamp",
+    "event_type",
+    "position_id",
+    "scenario",
+    "exchange_a",
+    "exchange_b",
+    "symbol_a",
+    "symbol_b",
+    "order_type",
+    "side",
+    "quantity",
+    "price",
+    "pnl",
+    "status",
+    "error_message",
+    "metadata",
+)
+
+_LIFECYCLE_EVENTS = (
+    "position_created",
+    "position_opened",
+    "position_closed",
+    "position_error",
+)
+
+# Status of each position's most recent lifecycle event; binds _LIFECYCLE_EVENTS.
+# Events sharing a timestamp are ordered by insertion.
+_LATEST_STATUS_SQL = """
+    SELECT position_id, status
+    FROM (
+        SELECT position_id, status,
+               ROW_NUMBER() OVER (
+                   PARTITION BY position_id ORDER BY timestamp DESC, id DESC
+               ) AS rn
+        FROM trades
+        WHERE event_type IN (?, ?, ?, ?)
+          AND position_id IS NOT NULL
+          AND position_id != ''
+          AND position_id != 'ALERT'
+    )
+    WHERE rn = 1
+"""
+
+_CREATE_TABLE_SQL = """
+    CREATE TABLE IF NOT EXISTS trades (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        timestamp INTEGER NOT NULL,
+        event_type TEXT NOT NULL,
+        position_id TEXT,
+        scenario TEXT,
+        exchange_a TEXT,
+        exchange_b TEXT,
+        symbol_a TEXT,
+        symbol_b TEXT,
+        order_type TEXT,
+        side TEXT,
+        quantity REAL,
+        price REAL,
+        pnl REAL,
+        status TEXT,
+        error_message TEXT,
+        metadata TEXT
+    )
+"""
+
+_INSERT_SQL = (
+    f"INSERT INTO trades ({', '.join(_FIELDS)}) "
+    f"VALUES ({', '.join('?' * len(_FIELDS))})"
+)
+
+# SQLite stores timestamps as integer microseconds since the Unix epoch; the
+# CSV file and the public read methods keep ISO-8601 strings.
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_MICROSECOND = timedelta(microseconds=1)
+
+
+def _to_micros(ts: datetime) -> int:
+    return (ts - _EPOCH) // _MICROSECOND
+
+
+def _from_micros(micros: int) -> datetime:
+    return _EPOCH + micros * _MICROSECOND
+
+
+def _iso_to_micros(raw: str | None) -> int:
+    """Convert a legacy ISO-8601 timestamp; unparseable values map to the epoch."""
+    try:
+        ts = datetime.fromisoformat(raw)
+    except (TypeError, ValueError):
+        return 0
+    if ts.tzinfo is None:
+        ts = ts.replace(tzinfo=timezone.utc)
+    return _to_micros(ts)
+
+
+def _dumps_metadata(metadata: Dict[str, Any]) -> str:
+    """Encode metadata as JSON text, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(metadata).decode()
+    return json.dumps(metadata)
+
+
+def _close_at_exit(ref: weakref.ReferenceType[TradeHistory]) -> None:
+    history = ref()
+    if history is not None:
+        history.close()
+
+
+def _format_row(row: sqlite3.Row) -> Dict[str, Any]:
+    record = dict(row)
+    record["timestamp"] = _from_micros(record["timestamp"]).isoformat()
+    return record
+
 
 class TradeHistory:
     """Manages trade and order history in CSV and SQLite formats."""
@@ -25,80 +177,140 @@ class TradeHistory:
         
         self.csv_file = self.data_dir / "trades.csv"
         self.sqlite_file = self.data_dir / "trades.db"
+        # One connection serves every read and write; the lock serializes
+        # callers from the order manager and worker threads.
+        self._lock = threading.Lock()
+        self._conn = self._connect()
+        self._pending: List[tuple] = []
+        self._flush_timer: threading.Timer | None = None
+        self._last_cleanup = _LAST_CLEANUP.get(self.sqlite_file.resolve(), float("-inf"))
+        self._closed = False
         self._init_csv()
         self._init_sqlite()
+        # Queued events would be lost if the process exits without close()
+        self._atexit = partial(_close_at_exit, weakref.ref(self))
+        atexit.register(self._atexit)
         
-        # Clean old records (keep only last 24h in SQLite)
-        self._cleanup_old_records()
+        # Clean old records (keep only last 24h in SQLite), at most hourly per
+        # database file; long-running processes repeat it from batch flushes
+        if time.monotonic() - self._last_cleanup >= _CLEANUP_INTERVAL:
+            self._cleanup_old_records()
 
     def _init_csv(self) -> None:
-        """Initialize CSV file with headers if it doesn't exist."""
-        if not self.csv_file.exists():
-            with open(self.csv_file, "w", newline="", encoding="utf-8") as f:
-                writer = csv.writer(f)
-                writer.writerow([
-                    "timestamp",
-                    "event_type",
-                    "position_id",
-                    "scenario",
-                    "exchange_a",
-                    "exchange_b",
-                    "symbol_a",
-                    "symbol_b",
-                    "order_type",
-                    "side",
-                    "quantity",
-                    "price",
-                    "pnl",
-                    "status",
-                    "error_message",
-                    "metadata"
-                ])
+        """Open the CSV file for appending, writing headers if it is new."""
+        is_new = not self.csv_file.exists()
+        self._csv_fh = open(self.csv_file, "a", newline="", encoding="utf-8", buffering=1 << 16)
+        self._csv_writer = csv.writer(self._csv_fh)
+        if is_new:
+            self._csv_writer.writerow(_FIELDS)
+            self._csv_fh.flush()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the long-lived connection to the history database.
+
+        It runs in autocommit mode, so each statement commits on its own.
+        """
+        conn = sqlite3.connect(self.sqlite_file, isolation_level=None, check_same_thread=False)
+        conn.executescript(_CONNECTION_PRAGMAS)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def close(self) -> None:
+        """Flush pending events and close the database connection."""
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            atexit.unregister(self._atexit)
+            self._flush_pending()
+            self._conn.close()
+            self._csv_fh.close()
+
+    def flush(self) -> None:
+        """Write all queued events to CSV and SQLite."""
+        with self._lock:
+            if not self._closed:
+                self._flush_pending()
+
+    def _flush_pending(self) -> None:
+        """Write queued events; the caller must hold the lock."""
+        if self._flush_timer is not None:
+            self._flush_timer.cancel()
+            self._flush_timer = None
+        if not self._pending:
+            return
+        records, self._pending = self._pending, []
+        self._record_to_csv(records)
+        self._record_to_sqlite(records)
+        if time.monotonic() - self._last_cleanup >= _CLEANUP_INTERVAL:
+            self._delete_old_records()
 
     def _init_sqlite(self) -> None:
         """Initialize SQLite database with tables."""
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.execute("""
-                CREATE TABLE IF NOT EXISTS trades (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    timestamp TEXT NOT NULL,
-                    event_type TEXT NOT NULL,
-                    position_id TEXT,
-                    scenario TEXT,
-                    exchange_a TEXT,
-                    exchange_b TEXT,
-                    symbol_a TEXT,
-                    symbol_b TEXT,
-                    order_type TEXT,
-                    side TEXT,
-                    quantity REAL,
-                    price REAL,
-                    pnl REAL,
-                    status TEXT,
-                    error_message TEXT,
-                    metadata TEXT
-                )
-            """)
+        with self._lock:
+            conn = self._conn
+            conn.execute("PRAGMA journal_mode = WAL")
+            conn.execute(_CREATE_TABLE_SQL)
+            columns = conn.execute("PRAGMA table_info(trades)").fetchall()
+            if any(c["name"] == "timestamp" and c["type"] == "TEXT" for c in columns):
+                self._migrate_text_timestamps(conn)
             
             conn.execute("""
                 CREATE INDEX IF NOT EXISTS idx_timestamp 
                 ON trades(timestamp)
             """)
             
+            # Covers per-position history ordered by time and the
+            # latest-lifecycle-event lookup; supersedes idx_position_id.
+            conn.execute("DROP INDEX IF EXISTS idx_position_id")
+
             conn.execute("""
-                CREATE INDEX IF NOT EXISTS idx_position_id 
-                ON trades(position_id)
+                CREATE INDEX IF NOT EXISTS idx_pos_ts
+                ON trades(position_id, timestamp)
             """)
 
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_evt_pos_ts
+                ON trades(event_type, position_id, timestamp)
+            """)
+
+    @staticmethod
+    def _migrate_text_timestamps(conn: sqlite3.Connection) -> None:
+        """Rebuild a table created with ISO-8601 TEXT timestamps."""
+        columns = ", ".join(_FIELDS[1:])
+        conn.create_function("iso_to_micros", 1, _iso_to_micros, deterministic=True)
+        conn.execute("BEGIN")
+        try:
+            conn.execute("ALTER TABLE trades RENAME TO trades_text_ts")
+            conn.execute(_CREATE_TABLE_SQL)
+            conn.execute(f"""
+                INSERT INTO trades (id, timestamp, {columns})
+                SELECT id, iso_to_micros(timestamp), {columns} FROM trades_text_ts
+            """)
+            conn.execute("DROP TABLE trades_text_ts")
+            conn.execute("COMMIT")
+        except Exception:
+            conn.rollback()
+            raise
+        logger.info("Migrated trade history timestamps to integer microseconds")
+
     def _cleanup_old_records(self) -> None:
         """Remove records older than 24 hours from SQLite."""
+        with self._lock:
+            self._delete_old_records()
+
+    def _delete_old_records(self) -> None:
+        """Delete expired records; the caller must hold the lock."""
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=24)
-        
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.execute(
+        self._last_cleanup = _LAST_CLEANUP[self.sqlite_file.resolve()] = time.monotonic()
+        try:
+            self._conn.execute(
                 "DELETE FROM trades WHERE timestamp < ?",
-                (cutoff_time.isoformat(),)
+                (_to_micros(cutoff_time),)
             )
+        except sqlite3.Error as e:
+            logger.error("Failed to clean up SQLite records: %s", e)
+        else:
             logger.debug("Cleaned up SQLite records older than 24h")
 
     def record_trade_event(
@@ -115,62 +327,64 @@ class TradeHistory:
         metadata: Dict[str, Any] | None = None,
     ) -> None:
         """Record a trade event in both CSV and SQLite."""
-        timestamp = datetime.now(timezone.utc).isoformat()
-        
-        # Prepare record data
-        record = {
-            "timestamp": timestamp,
-            "event_type": event_type,
-            "position_id": position.position_id,
-            "scenario": position.scenario,
-            "exchange_a": position.exchange_a,
-            "exchange_b": position.exchange_b,
-            "symbol_a": position.symbol_a,
-            "symbol_b": position.symbol_b,
-            "order_type": order_type,
-            "side": side,
-            "quantity": quantity,
-            "price": price,
-            "pnl": pnl,
-            "status": status,
-            "error_message": error_message,
-            "metadata": json.dumps(metadata) if metadata else "",
-        }
-
-        # Record to CSV (append)
-        self._record_to_csv(record)
+        timestamp = time.time_ns() // 1000
         
-        # Record to SQLite
-        self._record_to_sqlite(record)
+        # Prepare the row in _FIELDS order
+        record = (
+            timestamp,
+            event_type,
+            position.position_id,
+            position.scenario,
+            position.exchange_a,
+            position.exchange_b,
+            position.symbol_a,
+            position.symbol_b,
+            order_type,
+            side,
+            quantity,
+            price,
+            pnl,
+            status,
+            error_message,
+            _dumps_metadata(metadata) if metadata else "",
+        )
 
-    def _record_to_csv(self, record: Dict[str, Any]) -> None:
-        """Record event to CSV file."""
+        # Queue for the next batch; reads flush the queue first
+        with self._lock:
+            if self._closed:
+                raise sqlite3.ProgrammingError("Cannot record to a closed trade history")
+            self._pending.append(record)
+            if len(self._pending) >= _FLUSH_ROWS:
+                self._flush_pending()
+            elif self._flush_timer is None:
+                self._flush_timer = threading.Timer(_FLUSH_INTERVAL, self.flush)
+                self._flush_timer.daemon = True
+                self._flush_timer.start()
+
+    def _record_to_csv(self, records: Sequence[tuple]) -> None:
+        """Append a batch of events to the CSV file."""
         try:
-            with open(self.csv_file, "a", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=record.keys())
-                writer.writerow(record)
+            self._csv_writer.writerows(
+                (_from_micros(record[0]).isoformat(), *record[1:]) for record in records
+            )
+            self._csv_fh.flush()
         except Exception as e:
             logger.error("Failed to write to CSV: %s", e)
 
-    def _record_to_sqlite(self, record: Dict[str, Any]) -> None:
-        """Record event to SQLite database."""
+    def _record_to_sqlite(self, records: Sequence[tuple]) -> None:
+        """Insert a batch of events in a single transaction."""
+        conn = self._conn
         try:
-            with sqlite3.connect(self.sqlite_file) as conn:
-                conn.execute("""
-                    INSERT INTO trades (
-                        timestamp, event_type, position_id, scenario,
-                        exchange_a, exchange_b, symbol_a, symbol_b,
-                        order_type, side, quantity, price, pnl,
-                        status, error_message, metadata
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    record["timestamp"], record["event_type"], record["position_id"],
-                    record["scenario"], record["exchange_a"], record["exchange_b"],
-                    record["symbol_a"], record["symbol_b"], record["order_type"],
-                    record["side"], record["quantity"], record["price"], record["pnl"],
-                    record["status"], record["error_message"], record["metadata"]
-                ))
+            # The connection autocommits, so the transaction is opened explicitly
+            conn.execute("BEGIN")
+            conn.executemany(_INSERT_SQL, records)
+            conn.execute("COMMIT")
         except Exception as e:
+            try:
+                if conn.in_transaction:
+                    conn.rollback()
+            except sqlite3.Error:
+                pass
             logger.error("Failed to write to SQLite: %s", e)
 
     def record_position_created(self, position: Position) -> None:
@@ -368,37 +582,48 @@ class TradeHistory:
         """Get recent trades from SQLite (last N hours)."""
         cutoff_time = datetime.now(timezone.utc) - timedelta(hours=hours)
         
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._flush_pending()
+            conn = self._conn
             cursor = conn.execute("""
                 SELECT * FROM trades 
                 WHERE timestamp > ?
                 ORDER BY timestamp DESC
-            """, (cutoff_time.isoformat(),))
+            """, (_to_micros(cutoff_time),))
             
-            return [dict(row) for row in cursor.fetchall()]
+            return [_format_row(row) for row in cursor.fetchall()]
 
     def get_position_history(self, position_id: str) -> List[Dict[str, Any]]:
         """Get all events for a specific position."""
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.row_factory = sqlite3.Row
+        return [_format_row(row) for row in self._position_events(position_id)]
+
+    def _position_events(self, position_id: str) -> List[sqlite3.Row]:
+        """Fetch a position's rows, ordered by timestamp, as stored."""
+        with self._lock:
+            self._flush_pending()
+            conn = self._conn
             cursor = conn.execute(
                 """
                 SELECT * FROM trades 
                 WHERE position_id = ?
-                ORDER BY timestamp
+                ORDER BY timestamp, id
             """,
                 (position_id,),
             )
 
-            return [dict(row) for row in cursor.fetchall()]
+            return cursor.fetchall()
 
     def load_position(self, position_id: str) -> Position | None:
         """Reconstruct a Position from persisted history."""
-        events = self.get_position_history(position_id)
+        events = [dict(row) for row in self._position_events(position_id)]
         if not events:
             return None
+        return self._reconstruct_position(position_id, events)
 
+    def _reconstruct_position(
+        self, position_id: str, events: List[Dict[str, Any]]
+    ) -> Position | None:
+        """Build a Position from its events, ordered by timestamp."""
         created = next((e for e in events if e.get("event_type") == "position_created"), None)
         if created is None:
             return None
@@ -425,8 +650,7 @@ class TradeHistory:
         lifecycle = [
             e
             for e in events
-            if e.get("event_type")
-            in {"position_created", "position_opened", "position_closed", "position_error"}
+            if e.get("event_type") in _LIFECYCLE_EVENTS
         ]
         latest_lifecycle = lifecycle[-1] if lifecycle else created
         latest_status = latest_lifecycle.get("status")
@@ -463,22 +687,39 @@ class TradeHistory:
 
     def list_positions(self, *, status: str | None = None) -> list[Position]:
         """List positions reconstructed from history."""
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            self._flush_pending()
+            conn = self._conn
+            if status is None:
+                cursor = conn.execute(
+                    """
+                    SELECT *
+                    FROM trades
+                    WHERE position_id IS NOT NULL
+                      AND position_id != ''
+                      AND position_id != 'ALERT'
+                    ORDER BY position_id, timestamp, id
                 """
-                SELECT DISTINCT position_id
-                FROM trades
-                WHERE position_id IS NOT NULL
-                  AND position_id != ''
-                  AND position_id != 'ALERT'
-            """
-            )
-            position_ids = [row["position_id"] for row in cursor.fetchall()]
+                )
+            else:
+                # Only fetch histories of positions whose latest status matches
+                cursor = conn.execute(
+                    f"""
+                    WITH latest AS ({_LATEST_STATUS_SQL})
+                    SELECT *
+                    FROM trades
+                    WHERE position_id IN (
+                        SELECT position_id FROM latest WHERE status = ?
+                    )
+                    ORDER BY position_id, timestamp, id
+                """,
+                    (*_LIFECYCLE_EVENTS, status),
+                )
+            rows = cursor.fetchall()
 
         positions: list[Position] = []
-        for pid in position_ids:
-            position = self.load_position(pid)
+        for pid, group in groupby(rows, key=itemgetter("position_id")):
+            position = self._reconstruct_position(pid, [dict(row) for row in group])
             if position is None:
                 continue
             if status is not None and position.status.value != status:
@@ -489,33 +730,10 @@ class TradeHistory:
 
     def count_open_positions(self) -> int:
         """Count positions whose latest lifecycle status is OPENED."""
-        lifecycle_events = (
-            "position_created",
-            "position_opened",
-            "position_closed",
-            "position_error",
-        )
-
-        with sqlite3.connect(self.sqlite_file) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
-                """
-                SELECT t1.position_id, t1.status
-                FROM trades t1
-                JOIN (
-                    SELECT position_id, MAX(timestamp) AS max_ts
-                    FROM trades
-                    WHERE event_type IN (?, ?, ?, ?)
-                      AND position_id IS NOT NULL
-                      AND position_id != ''
-                      AND position_id != 'ALERT'
-                    GROUP BY position_id
-                ) t2
-                  ON t1.position_id = t2.position_id
-                 AND t1.timestamp = t2.max_ts
-            """,
-                lifecycle_events,
-            )
+        with self._lock:
+            self._flush_pending()
+            conn = self._conn
+            cursor = conn.execute(_LATEST_STATUS_SQL, _LIFECYCLE_EVENTS)
 
             return sum(
                 1
@@ -528,13 +746,15 @@ class TradeHistory:
         if not raw:
             return {}
         try:
-            parsed = json.loads(raw)
+            parsed = orjson.loads(raw) if orjson is not None else json.loads(raw)
         except Exception:
             return {}
         return parsed if isinstance(parsed, dict) else {}
 
     @staticmethod
-    def _parse_timestamp(raw: str | None) -> datetime | None:
+    def _parse_timestamp(raw: int | str | None) -> datetime | None:
+        if isinstance(raw, int):
+            return _from_micros(raw)
         if not raw:
             return None
         try:
@@ -0,0 +1,8 @@
+"""Filesystem locations shared across parcer modules."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "parcer"
@@ -5,6 +5,7 @@ import logging
 from pathlib import Path
 
 from .di import AppContainer
+from .exchanges.init import close_all, connect_exchange_clients
 from .history import TradeHistory
 from .orders.manager import OrderManager
 from .strategy.scenario_a import ScenarioAStrategy
@@ -13,6 +14,8 @@ from .strategy.spread_engine import PriceType, SpreadDetectionEngine
 
 logger = logging.getLogger(__name__)
 
+_DATA_DIR = Path("data")
+
 
 async def run(container: AppContainer) -> None:
     logger.info("runtime starting")
@@ -44,12 +47,13 @@ async def run(container: AppContainer) -> None:
         logger.info("runtime stopped")
         return
 
-    history = TradeHistory(Path("data"))
+    history = TradeHistory(_DATA_DIR)
     order_manager = OrderManager(container.settings, history)
     spread_engine = SpreadDetectionEngine()
 
     client_a = container.exchange_clients[arb.exchange_a]
     client_b = container.exchange_clients[arb.exchange_b]
+    await connect_exchange_clients({arb.exchange_a: client_a, arb.exchange_b: client_b})
 
     async def _consume_mark_price(exchange_client, symbol: str) -> None:
         async for update in exchange_client.stream_mark_price(symbol):
@@ -60,7 +64,7 @@ async def run(container: AppContainer) -> None:
                 price_type=PriceType.MARK,
                 timestamp=update.timestamp,
             )
-            if container.shutdown.is_set():
+            if container.shutdown_event.is_set():
                 return
 
     async def _consume_spot_price(exchange_client, symbol: str) -> None:
@@ -72,13 +76,13 @@ async def run(container: AppContainer) -> None:
                 price_type=PriceType.SPOT,
                 timestamp=update.timestamp,
             )
-            if container.shutdown.is_set():
+            if container.shutdown_event.is_set():
                 return
 
     async def _trade_loop_scenario_a() -> None:
         strategy = ScenarioAStrategy(spread_engine, order_manager)
 
-        while not container.shutdown.is_set():
+        while not container.shutdown_event.is_set():
             futures_price = spread_engine.get_price(client_a.name, arb.symbol)
             spot_price = spread_engine.get_price(client_b.name, arb.symbol)
 
@@ -110,7 +114,7 @@ async def run(container: AppContainer) -> None:
     async def _trade_loop_scenario_b() -> None:
         strategy = ScenarioBStrategy(spread_engine, order_manager)
 
-        while not container.shutdown.is_set():
+        while not container.shutdown_event.is_set():
             price_a = spread_engine.get_price(client_a.name, arb.symbol)
             price_b = spread_engine.get_price(client_b.name, arb.symbol)
 
@@ -144,14 +148,18 @@ async def run(container: AppContainer) -> None:
 
             await asyncio.sleep(0.5)
 
-    async with asyncio.TaskGroup() as tg:
-        if arb.scenario == "a":
-            tg.create_task(_consume_mark_price(client_a, arb.symbol))
-            tg.create_task(_consume_spot_price(client_b, arb.symbol))
-            tg.create_task(_trade_loop_scenario_a())
-        else:
-            tg.create_task(_consume_mark_price(client_a, arb.symbol))
-            tg.create_task(_consume_mark_price(client_b, arb.symbol))
-            tg.create_task(_trade_loop_scenario_b())
+    try:
+        async with asyncio.TaskGroup() as tg:
+            if arb.scenario == "a":
+                tg.create_task(_consume_mark_price(client_a, arb.symbol))
+                tg.create_task(_consume_spot_price(client_b, arb.symbol))
+                tg.create_task(_trade_loop_scenario_a())
+            else:
+                tg.create_task(_consume_mark_price(client_a, arb.symbol))
+                tg.create_task(_consume_mark_price(client_b, arb.symbol))
+                tg.create_task(_trade_loop_scenario_b())
+    finally:
+        await close_all(container.exchange_clients)
+        history.close()
 
     logger.info("runtime stopped")
@@ -245,8 +245,8 @@ def test_positions_list_command(mock_init_components):
 
 
 @patch('src.parcer.cli.init_components')
-@patch('asyncio.run')
-def test_balance_check_command(mock_asyncio_run, mock_init_components):
+@patch('src.parcer.cli._run')
+def test_balance_check_command(mock_run, mock_init_components):
     """Test balance check command."""
     runner = CliRunner()
     
@@ -267,7 +267,7 @@ def test_balance_check_command(mock_asyncio_run, mock_init_components):
     
     # Mock the async get_balance to return immediately
     mock_exchange_client.get_balance = AsyncMock(return_value=mock_balance)
-    mock_asyncio_run.side_effect = lambda coro: None  # Prevent actual async execution
+    mock_run.side_effect = lambda coro: coro.close()  # Prevent actual async execution
     
     # Run command
     result = runner.invoke(app, [
@@ -357,6 +357,37 @@ def test_history_show_json_format(mock_init_components):
     assert "position_opened" in result.output
 
 
+@patch('src.parcer.cli.init_components')
+def test_history_show_csv_format(mock_init_components):
+    """Test history show with CSV format."""
+    runner = CliRunner()
+    
+    # Mock components
+    mock_history = Mock()
+    mock_init_components.return_value = (Mock(), mock_history, Mock())
+    
+    # Mock trades data
+    mock_trade = dict.fromkeys(
+        ["timestamp", "event_type", "position_id", "scenario", "exchange_a", "exchange_b",
+         "symbol_a", "symbol_b", "order_type", "side", "quantity", "price", "pnl", "status"]
+    )
+    mock_trade.update(timestamp="2023-12-01T12:00:00Z", event_type="position_opened", position_id="pos-1")
+    
+    mock_history.get_recent_trades.return_value = [mock_trade]
+    
+    # Run command with CSV format
+    result = runner.invoke(app, [
+        "history-show",
+        "--format-type", "csv"
+    ])
+    
+    # Verify header and row were written
+    assert result.exit_code == 0
+    lines = result.output.splitlines()
+    assert lines[0].startswith("timestamp,event_type,position_id")
+    assert lines[1] == "2023-12-01T12:00:00Z,position_opened,pos-1" + "," * 11
+
+
 def test_run_cli_function():
     """Test the run_cli function works with argv."""
     with patch('src.parcer.cli.app') as mock_app:
@@ -368,4 +399,17 @@ def test_run_cli_function_none():
     """Test the run_cli function works with None argv."""
     with patch('src.parcer.cli.app') as mock_app:
         run_cli(None)
-        mock_app.assert_called_once_with(None)
\ No newline at end of file
+        mock_app.assert_called_once_with(None)
+
+def test_run_cli_releases_cached_components():
+    """Test that run_cli closes cached components and drops them for the next run."""
+    from src.parcer import cli
+
+    history = Mock()
+    cli._COMPONENTS[None] = (Mock(), history, Mock())
+    with patch('src.parcer.cli.app'):
+        run_cli([])
+
+    history.close.assert_called_once_with()
+    assert not cli._COMPONENTS
+    assert cli._runner is None
@@ -0,0 +1,203 @@
+"""Tests for configuration loading."""
+
+from __future__ import annotations
+
+import os
+from unittest.mock import patch
+
+import pytest
+import yaml
+
+from parcer import config
+from parcer.config import _apply_env_overrides, _parse_env_value, load_settings
+
+
+CONFIG_YAML = """\
+trading:
+  leverage: 3
+  max_positions: 2
+exchanges:
+  binance:
+    credentials:
+      api_key: "key"
+      api_secret: "secret"
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Redirect the settings cache into a temporary directory."""
+    cache = tmp_path / "cache"
+    monkeypatch.setattr(config, "_CACHE_DIR", cache)
+    monkeypatch.setattr(config, "_SETTINGS_MEMO", {})
+    return cache
+
+
+@pytest.fixture
+def config_file(tmp_path):
+    """Write a small config file."""
+    path = tmp_path / "config.yml"
+    path.write_text(CONFIG_YAML, encoding="utf-8")
+    return path
+
+
+class TestLoadSettings:
+    """Tests for load_settings."""
+
+    def test_load_from_file(self, cache_dir, config_file):
+        """Test loading settings from a YAML file."""
+        settings = load_settings(config_file)
+
+        assert settings.trading.leverage == 3
+        assert settings.trading.max_positions == 2
+        assert settings.exchanges["binance"].credentials.api_secret.get_secret_value() == "secret"
+
+    def test_missing_file_uses_defaults(self, cache_dir, tmp_path):
+        """Test that a missing config file yields default settings."""
+        settings = load_settings(tmp_path / "missing.yml")
+
+        assert settings.trading.leverage == 1
+        assert not cache_dir.exists()
+
+    def test_env_override(self, cache_dir, config_file, monkeypatch):
+        """Test PARCER_* environment overrides."""
+        monkeypatch.setenv("PARCER_TRADING__MAX_POSITIONS", "5")
+
+        settings = load_settings(config_file)
+
+        assert settings.trading.max_positions == 5
+
+    def test_env_override_keeps_string_fields_verbatim(self, cache_dir, config_file, monkeypatch):
+        """Test that string fields are not coerced through YAML scalars."""
+        monkeypatch.setenv("PARCER_EXCHANGES__BINANCE__CREDENTIALS__API_KEY", "12345")
+        monkeypatch.setenv("PARCER_ARBITRAGE__SYMBOL", "null")
+        monkeypatch.setenv("PARCER_EXCHANGES__BINANCE__OPTIONS__RECV_WINDOW", "5000")
+
+        settings = load_settings(config_file)
+
+        assert settings.exchanges["binance"].credentials.api_key.get_secret_value() == "12345"
+        assert settings.arbitrage.symbol is None
+        assert settings.exchanges["binance"].options["recv_window"] == 5000
+
+
+class TestApplyEnvOverrides:
+    """Tests for merging PARCER_* overrides into loaded data."""
+
+    def test_no_overrides_returns_data(self, monkeypatch):
+        """Test that data is passed through untouched without overrides."""
+        monkeypatch.setattr(config.os, "environ", {"HOME": "/root"})
+        data = {"trading": {"leverage": 3}}
+
+        assert _apply_env_overrides(data) is data
+
+    def test_overrides_do_not_mutate_input(self, monkeypatch):
+        """Test that nested input mappings are left unchanged."""
+        monkeypatch.setattr(config.os, "environ", {"PARCER_TRADING__LEVERAGE": "5"})
+        data = {"trading": {"leverage": 3}}
+
+        merged = _apply_env_overrides(data)
+
+        assert merged["trading"]["leverage"] == 5
+        assert data == {"trading": {"leverage": 3}}
+
+
+class TestParseEnvValue:
+    """Tests for PARCER_* value parsing."""
+
+    @pytest.mark.parametrize(
+        "raw",
+        [
+            "true", "False", "YES", "off", "tRUE", "null", "~", "",
+            "42", "-7", "010", "0x1A", "1_000",
+            "1.5", "-0.25", "1e3", ".inf",
+            "binance", "BTC-USDT", "api_key_123",
+            "a: b", "[1, 2]", "{a: 1}", "2023-01-01", "12:30", "'quoted'",
+        ],
+    )
+    def test_matches_yaml(self, raw):
+        """Test that fast paths resolve exactly like YAML."""
+        expected = yaml.safe_load(raw)
+        value = _parse_env_value(raw)
+
+        assert value == expected
+        assert type(value) is type(expected)
+
+
+class TestSettingsCache:
+    """Tests for the on-disk settings cache."""
+
+    def test_cache_hit_skips_parsing(self, cache_dir, config_file):
+        """Test that a second load is served from the cache."""
+        first = load_settings(config_file)
+        assert list(cache_dir.glob("settings-*.pkl"))
+        config._SETTINGS_MEMO.clear()
+
+        with patch.object(config.yaml, "load", side_effect=AssertionError("re-parsed")):
+            second = load_settings(config_file)
+
+        assert second == first
+
+    def test_repeat_load_in_process_is_memoized(self, cache_dir, config_file):
+        """Test that repeat loads in one process return the same object."""
+        first = load_settings(config_file)
+
+        with patch.object(config, "_read_cached_settings", side_effect=AssertionError("disk hit")):
+            assert load_settings(config_file) is first
+
+    def test_cache_invalidated_on_file_change(self, cache_dir, config_file):
+        """Test that editing the config file invalidates the cache."""
+        load_settings(config_file)
+
+        config_file.write_text(CONFIG_YAML.replace("leverage: 3", "leverage: 7"), encoding="utf-8")
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert load_settings(config_file).trading.leverage == 7
+
+    def test_cache_survives_touch(self, cache_dir, config_file):
+        """Test that an mtime-only change is still served from the cache."""
+        load_settings(config_file)
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        with patch.object(config.yaml, "load", side_effect=AssertionError("re-parsed")):
+            assert load_settings(config_file).trading.leverage == 3
+
+    def test_cache_keyed_on_content(self, cache_dir, config_file):
+        """Test that an edit preserving mtime and size still invalidates."""
+        load_settings(config_file)
+        config._SETTINGS_MEMO.clear()
+        stat = config_file.stat()
+
+        config_file.write_text(CONFIG_YAML.replace("leverage: 3", "leverage: 7"), encoding="utf-8")
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+        assert load_settings(config_file).trading.leverage == 7
+
+    def test_cache_invalidated_on_env_change(self, cache_dir, config_file, monkeypatch):
+        """Test that PARCER_* environment changes invalidate the cache."""
+        assert load_settings(config_file).trading.max_positions == 2
+
+        monkeypatch.setenv("PARCER_TRADING__MAX_POSITIONS", "4")
+
+        assert load_settings(config_file).trading.max_positions == 4
+
+    def test_cache_invalidated_on_schema_change(self, cache_dir, config_file, monkeypatch):
+        """Test that a cache written for another Settings schema is not reused."""
+        load_settings(config_file)
+        config._SETTINGS_MEMO.clear()
+        monkeypatch.setattr(config, "_schema_stamp", lambda: ("other-schema",))
+
+        with patch.object(config, "_load_settings_uncached", wraps=config._load_settings_uncached) as load:
+            load_settings(config_file)
+
+        load.assert_called_once()
+
+    def test_corrupt_cache_is_ignored(self, cache_dir, config_file):
+        """Test that an unreadable cache file falls back to parsing."""
+        load_settings(config_file)
+        config._SETTINGS_MEMO.clear()
+        for cache_file in cache_dir.glob("settings-*.pkl"):
+            cache_file.write_bytes(b"not a pickle")
+
+        assert load_settings(config_file).trading.leverage == 3
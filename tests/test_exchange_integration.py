@@ -1,6 +1,7 @@
 """Integration tests for exchange adapters."""
 
 import asyncio
+import json
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -18,6 +19,7 @@ def create_async_response(status=200, json_data=None):
     resp = AsyncMock()
     resp.status = status
     resp.json = AsyncMock(return_value=json_data or {})
+    resp.read = AsyncMock(return_value=json.dumps(json_data or {}).encode())
     resp.__aenter__ = AsyncMock(return_value=resp)
     resp.__aexit__ = AsyncMock(return_value=None)
     return resp
@@ -2,6 +2,7 @@
 
 import pytest
 
+from parcer.exchanges.base import BaseExchangeClient
 from parcer.exchanges.factory import create_exchange_client, EXCHANGE_CLIENTS
 from parcer.exchanges.binance import BinanceClient
 from parcer.exchanges.okx import OKXClient
@@ -112,6 +113,13 @@ class TestExchangeFactory:
         }
         assert expected.issubset(EXCHANGE_CLIENTS.keys())
 
+    def test_registry_resolves_client_classes(self):
+        """Test that every registry entry loads its adapter class."""
+        for name, client_class in EXCHANGE_CLIENTS.items():
+            assert issubclass(client_class, BaseExchangeClient), name
+
+        assert EXCHANGE_CLIENTS["bybit"] is BybitClient
+
     def test_case_insensitive_exchange_names(self):
         """Test that exchange names are case-insensitive."""
         client1 = create_exchange_client(
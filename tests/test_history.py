@@ -50,6 +50,98 @@ class TestTradeHistory:
                 """)
                 assert cursor.fetchone() is not None
 
+    def test_init_sqlite_enables_wal(self):
+        """Test that the database is switched to write-ahead logging."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            TradeHistory(data_dir)
+
+            with sqlite3.connect(data_dir / "trades.db") as conn:
+                assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+
+    def test_connection_is_reused(self):
+        """Test that every call shares one connection until close()."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = TradeHistory(Path(temp_dir))
+            position = self._create_mock_position()
+
+            with patch("src.parcer.history.sqlite3.connect") as connect:
+                history.record_position_created(position)
+                assert len(history.get_recent_trades(hours=1)) == 1
+            connect.assert_not_called()
+
+            history.close()
+            with pytest.raises(sqlite3.ProgrammingError):
+                history.get_recent_trades(hours=1)
+
+    def test_events_are_committed_in_batches(self):
+        """Test that queued events are written together on flush."""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("src.parcer.history._FLUSH_INTERVAL", 60):
+            data_dir = Path(temp_dir)
+            history = TradeHistory(data_dir)
+            position = self._create_mock_position()
+
+            history.record_position_created(position)
+            history.record_position_opened(position)
+            with sqlite3.connect(data_dir / "trades.db") as conn:
+                assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 0
+
+            history.flush()
+            with sqlite3.connect(data_dir / "trades.db") as conn:
+                assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 2
+            assert len((data_dir / "trades.csv").read_text().strip().split("\n")) == 3
+
+    def test_record_after_close_is_rejected(self):
+        """Test that events are not queued behind a closed connection."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = TradeHistory(Path(temp_dir))
+            history.close()
+
+            with pytest.raises(sqlite3.ProgrammingError):
+                history.record_position_created(self._create_mock_position())
+            assert history._flush_timer is None
+            history.close()
+
+    def test_pending_events_are_flushed_at_exit(self):
+        """Test that the exit hook writes events queued without close()."""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("src.parcer.history._FLUSH_INTERVAL", 60):
+            data_dir = Path(temp_dir)
+            history = TradeHistory(data_dir)
+            history.record_position_created(self._create_mock_position())
+
+            history._atexit()
+            with sqlite3.connect(data_dir / "trades.db") as conn:
+                assert conn.execute("SELECT COUNT(*) FROM trades").fetchone()[0] == 1
+
+    def test_text_timestamps_are_migrated(self):
+        """Test that a table with ISO-8601 timestamps is converted to integers."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            recent = datetime.now(timezone.utc) - timedelta(hours=1)
+            with sqlite3.connect(data_dir / "trades.db") as conn:
+                conn.execute(
+                    "CREATE TABLE trades (id INTEGER PRIMARY KEY AUTOINCREMENT, "
+                    "timestamp TEXT NOT NULL, event_type TEXT NOT NULL, position_id TEXT, "
+                    "scenario TEXT, exchange_a TEXT, exchange_b TEXT, symbol_a TEXT, "
+                    "symbol_b TEXT, order_type TEXT, side TEXT, quantity REAL, price REAL, "
+                    "pnl REAL, status TEXT, error_message TEXT, metadata TEXT)"
+                )
+                conn.execute(
+                    "INSERT INTO trades (timestamp, event_type, position_id) VALUES (?, ?, ?)",
+                    (recent.isoformat(), "position_created", "pos-1"),
+                )
+            conn.close()
+
+            history = TradeHistory(data_dir)
+
+            trades = history.get_recent_trades(hours=2)
+            assert len(trades) == 1
+            assert datetime.fromisoformat(trades[0]["timestamp"]) == recent
+            stored = history._conn.execute("SELECT typeof(timestamp) FROM trades").fetchone()[0]
+            assert stored == "integer"
+
     def test_record_position_created(self):
         """Test recording position creation."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -61,6 +153,7 @@ class TestTradeHistory:
             
             # Record position creation
             history.record_position_created(position)
+            history.flush()
             
             # Verify CSV record
             csv_file = data_dir / "trades.csv"
@@ -261,20 +354,54 @@ class TestTradeHistory:
             
             # Simulate cleanup by directly manipulating the database
             # (since the cleanup happens automatically on initialization)
-            old_timestamp = (datetime.now(timezone.utc) - timedelta(hours=25)).isoformat()
+            old_timestamp = int(
+                (datetime.now(timezone.utc) - timedelta(hours=25)).timestamp() * 1_000_000
+            )
             with sqlite3.connect(data_dir / "trades.db") as conn:
                 conn.execute(
                     "UPDATE trades SET timestamp = ? WHERE position_id = ?",
                     (old_timestamp, position.position_id)
                 )
             
-            # Reinitialize history to trigger cleanup
-            history2 = TradeHistory(data_dir)
+            # Reinitialize history once the cleanup interval has passed
+            with patch("src.parcer.history._CLEANUP_INTERVAL", 0):
+                history2 = TradeHistory(data_dir)
             
             # Verify trade was cleaned up
             trades = history2.get_recent_trades(hours=24)
             assert len(trades) == 0
 
+    def test_startup_cleanup_is_rate_limited(self):
+        """Test that reopening the database within the interval skips the sweep."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            data_dir = Path(temp_dir)
+            TradeHistory(data_dir).close()
+
+            with patch.object(TradeHistory, "_cleanup_old_records") as cleanup:
+                TradeHistory(data_dir).close()
+            cleanup.assert_not_called()
+
+    def test_cleanup_runs_periodically_on_flush(self):
+        """Test that a flush sweeps old records once the cleanup interval passes."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = TradeHistory(Path(temp_dir))
+            old_timestamp = int(
+                (datetime.now(timezone.utc) - timedelta(hours=25)).timestamp() * 1_000_000
+            )
+            history._conn.execute(
+                "INSERT INTO trades (timestamp, event_type, position_id) VALUES (?, ?, ?)",
+                (old_timestamp, "position_created", "old-pos"),
+            )
+
+            history.record_position_created(self._create_mock_position())
+            history.flush()
+            assert len(history.get_position_history("old-pos")) == 1
+
+            with patch("src.parcer.history._CLEANUP_INTERVAL", 0):
+                history.record_position_created(self._create_mock_position())
+                history.flush()
+            assert history.get_position_history("old-pos") == []
+
     def test_multiple_events_persistence(self):
         """Test that multiple events are properly persisted."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -305,6 +432,45 @@ class TestTradeHistory:
             pos2_history = history.get_position_history("pos-2")
             assert len(pos2_history) == 1
 
+    def test_list_positions_groups_events_by_position(self):
+        """Test that positions are rebuilt from one sweep of the history."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            history = TradeHistory(Path(temp_dir))
+            position1 = self._create_mock_position(position_id="pos-1")
+            position2 = self._create_mock_position(position_id="pos-2")
+
+            history.record_position_created(position1)
+            history.record_position_created(position2)
+            history.record_position_opened(position1)
+            position1.mark_closed(50200.0, 50300.0)
+            history.record_position_closed(position1)
+            history.record_insufficient_balance("binance", "BTCUSDT", 10.0, 5.0)
+
+            positions = history.list_positions()
+            assert [p.position_id for p in positions] == ["pos-1", "pos-2"]
+            assert positions[0].status == PositionStatus.CLOSED
+            assert positions[0].exit_spread == position1.exit_spread
+
+            closed = history.list_positions(status=PositionStatus.CLOSED.value)
+            assert [p.position_id for p in closed] == ["pos-1"]
+
+    def test_latest_status_ignores_orders_at_lifecycle_timestamp(self):
+        """Test that an order row sharing the latest lifecycle timestamp does not set the status."""
+        with tempfile.TemporaryDirectory() as temp_dir, \
+                patch("src.parcer.history.time.time_ns", return_value=1_700_000_000_000_000_000):
+            history = TradeHistory(Path(temp_dir))
+            position = self._create_mock_position(position_id="pos-1")
+
+            history.record_position_created(position)
+            history.record_position_opened(position)
+            position.mark_closed(50200.0, 50300.0)
+            history.record_position_closed(position)
+            history.record_trade_event("order_placed", position, status="opened")
+
+            assert history.count_open_positions() == 0
+            closed = history.list_positions(status=PositionStatus.CLOSED.value)
+            assert [p.position_id for p in closed] == ["pos-1"]
+
     def _create_mock_position(self, position_id: str | None = None):
         """Create a mock position for testing."""
         from src.parcer.orders.position import Position
@@ -78,6 +78,12 @@ class TestExtractBaseSymbol:
         base, quote = extract_base_symbol("ETHUSDC")
         assert quote == "USDC"
 
+    def test_longer_quote_wins(self):
+        """Test that four-letter quotes are matched before DAI, and bare quotes stay whole."""
+        assert extract_base_symbol("ETHDAI") == ("ETH", "DAI")
+        assert extract_base_symbol("TUSDT") == ("T", "USDT")
+        assert extract_base_symbol("USDT") == ("USDT", "")
+
     def test_case_insensitive(self):
         """Test case insensitivity."""
         assert extract_base_symbol("btcusdt") == ("BTC", "USDT")
@@ -147,3 +153,12 @@ class TestNormalizationIntegration:
             base, quote = extract_base_symbol(symbol)
             assert base == "BTC"
             assert quote == "USDT"
+
+    def test_repeat_calls_are_cached(self):
+        """Test that repeated symbols are served from the memo cache."""
+        normalize_symbol.cache_clear()
+
+        normalize_symbol("eth-usdc", "slash")
+        assert normalize_symbol("eth-usdc", "slash") == "ETH/USDC"
+
+        assert normalize_symbol.cache_info().hits == 1